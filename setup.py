@@ -10,10 +10,15 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "click>=8.1.0",
-        "hypothesis>=6.92.0",
-        "pytest>=7.4.0",
         "PyYAML>=6.0.0",
     ],
+    extras_require={
+        "test": [
+            "hypothesis>=6.92.0",
+            "pytest>=7.4.0",
+            "pytest-xdist>=3.0.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "file-organizer=src.cli:main",
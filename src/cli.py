@@ -7,11 +7,18 @@ from typing import Optional
 import click
 
 from src.models import Config, OperationType, CaseType, OperationResults
-from src.orchestrator import Orchestrator, OrchestratorError
 from src.undo_manager import UndoManager
 from src.filesystem import FileSystem
 
 
+# Case choices accepted by the rename command
+CASE_TYPES = {
+    'lowercase': CaseType.LOWERCASE,
+    'uppercase': CaseType.UPPERCASE,
+    'title': CaseType.TITLE,
+}
+
+
 # Global options that apply to all commands
 def add_global_options(func):
     """Decorator to add common global options to commands."""
@@ -126,7 +133,7 @@ def organize_date(
 )
 @click.option(
     '--case',
-    type=click.Choice(['lowercase', 'uppercase', 'title'], case_sensitive=False),
+    type=click.Choice(list(CASE_TYPES), case_sensitive=False),
     help='Case transformation to apply'
 )
 @click.option(
@@ -190,7 +197,7 @@ def rename(
     # Convert case string to CaseType enum
     case_type = None
     if case:
-        case_type = CaseType[case.upper()]
+        case_type = CASE_TYPES[case.lower()]
     
     config = Config(
         target_dir=target_dir,
@@ -289,8 +296,19 @@ def execute_operation(config: Config):
     Args:
         config: Configuration object specifying the operation
     """
+    # Imported here so that undo and --help don't load the orchestrator
+    from src.orchestrator import Orchestrator, OrchestratorError
+    
     try:
-        orchestrator = Orchestrator()
+        # Only custom operations need the rule engine; persist parsed rules
+        # files so repeated runs skip re-parsing them
+        rule_engine = None
+        if config.operation_type == OperationType.CUSTOM:
+            from src.rule_engine import RuleEngine
+            from src.rules_cache import RulesCache, default_cache_dir
+            rule_engine = RuleEngine(RulesCache(cache_dir=default_cache_dir()))
+        
+        orchestrator = Orchestrator(rule_engine=rule_engine)
         
         # Show dry-run notice
         if config.dry_run:
@@ -332,26 +350,30 @@ def display_results(
         click.echo("\nDetailed Operations:")
         click.echo("-" * 80)
         
+        # Style the status labels once rather than per operation
+        if dry_run:
+            done_status = click.style("WOULD EXECUTE", fg="yellow")
+        else:
+            done_status = click.style("SUCCESS", fg="green")
+        skipped_status = click.style("SKIPPED", fg="blue")
+        
+        # Show progress indicator for >10 files
+        show_progress = total_ops > 10
+        
+        # Collect all lines and write them in one go
+        lines = []
         for i, operation in enumerate(results.operations, 1):
-            # Show progress indicator for >10 files
-            if total_ops > 10:
-                click.echo(f"[{i}/{total_ops}] ", nl=False)
-            
-            # Determine status
-            if operation.executed or dry_run:
-                status = "WOULD EXECUTE" if dry_run else "SUCCESS"
-                status_color = "yellow" if dry_run else "green"
-            else:
-                status = "SKIPPED"
-                status_color = "blue"
+            status = done_status if operation.executed or dry_run else skipped_status
+            progress = f"[{i}/{total_ops}] " if show_progress else ""
             
             # Display operation details
-            click.echo(
-                f"{click.style(status, fg=status_color)} | "
+            lines.append(
+                f"{progress}{status} | "
                 f"{operation.operation_type.value.upper()} | "
                 f"{operation.source_path} → {operation.dest_path}"
             )
         
+        click.echo("\n".join(lines))
         click.echo("-" * 80)
     
     # Display summary
@@ -1,14 +1,62 @@
 """File system abstraction layer for file operations."""
 
+import errno
+import fnmatch
+import functools
 import os
+import re
 import shutil
+import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime
+from typing import AbstractSet, Callable, Dict, List, Optional, Set, Tuple
 
 from src.models import FileInfo
 
 
+def _is_nested_pattern(pattern: str) -> bool:
+    """Check whether a glob pattern reaches into subdirectories."""
+    return '/' in pattern or os.sep in pattern or '**' in pattern
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str, case_sensitive: bool) -> Optional[re.Pattern]:
+    """
+    Compile a single-level glob pattern into a regex, memoized per pattern.
+    
+    Args:
+        pattern: Glob pattern to compile
+        case_sensitive: Whether matching should be case-sensitive
+        
+    Returns:
+        Compiled regex, or None for "*" which matches every name
+    """
+    if pattern == "*":
+        return None
+    
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def list_names(directory: Path) -> Set[str]:
+    """
+    Get the names of all entries in a directory.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Set of entry names (empty if the directory cannot be read)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
 class FileSystemError(Exception):
     """Base exception for file system operations."""
     pass
@@ -29,14 +77,67 @@ class DiskSpaceError(FileSystemError):
     pass
 
 
+# OS errors that map to a more specific error than PathError
+_ERRNO_ERRORS = {
+    errno.EACCES: (PermissionError, "Permission denied"),
+    errno.EPERM: (PermissionError, "Permission denied"),
+    errno.ENOSPC: (DiskSpaceError, "Insufficient disk space"),
+}
+
+
+# link() errors meaning the filesystem can't hard-link these paths; the move
+# falls back to renaming (or copying, across devices) onto a reserved name
+_NO_LINK_ERRNOS = frozenset(
+    code for code in (
+        errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOSYS,
+        getattr(errno, 'ENOTSUP', None), getattr(errno, 'EOPNOTSUPP', None),
+    )
+    if code is not None
+)
+
+
+# Hard-link a symlink itself, as a rename would, where the platform allows it
+_LINK_KWARGS = {'follow_symlinks': False} if os.link in os.supports_follow_symlinks else {}
+
+
+def _canonical_dir(directory: Path) -> str:
+    """Identify a directory regardless of symlinks or case-folding spellings."""
+    return os.path.normcase(os.path.realpath(directory))
+
+
+def _translate_os_error(e: OSError) -> FileSystemError:
+    """
+    Convert an OSError into the matching FileSystemError.
+    
+    Args:
+        e: Error raised by the operating system
+        
+    Returns:
+        FileSystemError subclass instance describing the error
+    """
+    error_type, description = _ERRNO_ERRORS.get(e.errno, (PathError, "Path error"))
+    return error_type(f"{description}: {e}")
+
+
 class FileSystem:
     """Abstraction layer for file system operations with error handling."""
     
+    # Seconds a cached free-space probe stays valid
+    STATVFS_TTL = 2.0
+    
+    def __init__(self):
+        """Initialize the FileSystem."""
+        # Free-space probes keyed by directory: (probe time, available bytes)
+        self._statvfs_cache: Dict[Path, Tuple[float, int]] = {}
+    
     def move_file(self, source: Path, dest: Path) -> None:
         """
         Move a file from source to destination with conflict handling.
         
-        If a file exists at the destination, appends a numeric suffix.
+        If a file exists at the destination, appends a numeric suffix. The
+        file is hard-linked into place rather than renamed over it, so a
+        name another mover claims after it was resolved is never clobbered;
+        the next free suffix is tried instead.
         
         Args:
             source: Source file path
@@ -48,34 +149,145 @@ class FileSystem:
             DiskSpaceError: If insufficient disk space
         """
         try:
-            # Validate paths
-            if not source.exists():
+            # Validate paths with a single stat
+            try:
+                source_stat = os.stat(source)
+            except FileNotFoundError:
                 raise PathError(f"Source file does not exist: {source}")
             
-            if not source.is_file():
+            if not stat.S_ISREG(source_stat.st_mode):
                 raise PathError(f"Source is not a file: {source}")
             
-            # Check disk space
-            self._check_disk_space(source, dest.parent)
-            
             # Handle conflicts by adding numeric suffix
             final_dest = self._resolve_conflict(dest)
             
             # Ensure destination directory exists
             final_dest.parent.mkdir(parents=True, exist_ok=True)
             
-            # Move the file
-            shutil.move(str(source), str(final_dest))
+            claimed = set()
+            while True:
+                try:
+                    self._move_no_clobber(source, final_dest, source_stat.st_size)
+                    break
+                except FileExistsError:
+                    # Claimed since it was resolved (or present under another
+                    # case); take the next free name
+                    claimed.add(final_dest.name)
+                    final_dest = self._resolve_conflict(dest, claimed)
             
         except PermissionError as e:
             raise PermissionError(f"Permission denied: {e}")
         except OSError as e:
-            if e.errno == 13:  # Permission denied
-                raise PermissionError(f"Permission denied: {e}")
-            elif e.errno == 28:  # No space left on device
-                raise DiskSpaceError(f"Insufficient disk space: {e}")
-            else:
-                raise PathError(f"Path error: {e}")
+            raise _translate_os_error(e) from e
+    
+    def _move_no_clobber(self, source: Path, dest: Path, size: int) -> None:
+        """
+        Move a file to a destination name that must not exist yet.
+        
+        Args:
+            source: Source file path
+            dest: Destination file path
+            size: Source file size in bytes, for the cross-device space check
+            
+        Raises:
+            FileExistsError: If dest already exists; nothing was moved
+            OSError: If the move fails
+        """
+        src = os.fspath(source)
+        dst = os.fspath(dest)
+        
+        try:
+            # link() fails rather than replacing an existing name
+            os.link(src, dst, **_LINK_KWARGS)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            if e.errno not in _NO_LINK_ERRNOS:
+                raise
+            
+            # Reserve the name, then rename or copy over the reservation
+            os.close(os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            try:
+                if e.errno == errno.EXDEV:
+                    # Cross-device move: check space, then copy and remove source
+                    self._check_disk_space(source, dest.parent, size)
+                    shutil.copy2(src, dst)
+                else:
+                    os.replace(src, dst)
+                    return
+            except BaseException:
+                os.unlink(dst)
+                raise
+        
+        try:
+            os.unlink(src)
+        except BaseException:
+            os.unlink(dst)
+            raise
+    
+    def batch_move(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        workers: int = 8,
+        before_move: Optional[Callable[[int], None]] = None
+    ) -> List[Optional[Exception]]:
+        """
+        Move many files, running moves into different directories in parallel.
+        
+        The GIL is released during the underlying stat and rename syscalls,
+        so threads overlap the filesystem latency. Moves that share a
+        destination directory run in order on a single worker, so conflict
+        resolution within a directory never races with itself. Directories
+        are compared by their resolved path, case-normalized where the
+        platform folds case, so symlinked aliases of one directory share a
+        worker. Any alias this misses is still safe, since move_file never
+        overwrites an existing name. When a move takes its source from a
+        directory another group writes into, the groups depend on each other
+        and the whole batch runs serially in input order instead.
+        
+        Args:
+            pairs: List of (source, dest) paths to move
+            workers: Maximum number of worker threads
+            before_move: Optional callback given a pair's index just before
+                        that pair is moved, on the thread that moves it
+            
+        Returns:
+            One entry per pair, in input order: None if the move succeeded,
+            otherwise the exception move_file raised
+        """
+        results: List[Optional[Exception]] = [None] * len(pairs)
+        
+        # Group moves by destination directory, preserving input order
+        dest_dirs = [_canonical_dir(dest.parent) for _, dest in pairs]
+        groups: Dict[str, List[int]] = {}
+        for idx, dest_dir in enumerate(dest_dirs):
+            groups.setdefault(dest_dir, []).append(idx)
+        
+        def move_group(indices: List[int]) -> None:
+            for idx in indices:
+                try:
+                    if before_move is not None:
+                        before_move(idx)
+                    self.move_file(*pairs[idx])
+                except Exception as e:
+                    results[idx] = e
+        
+        # A source leaving a directory that another group moves into can
+        # change that group's conflict resolution, so order matters there
+        crosses_groups = any(
+            source_dir in groups and source_dir != dest_dir
+            for source_dir, dest_dir in zip(
+                (_canonical_dir(source.parent) for source, _ in pairs), dest_dirs
+            )
+        )
+        
+        if workers <= 1 or len(groups) <= 1 or crosses_groups:
+            move_group(range(len(pairs)))
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as executor:
+                list(executor.map(move_group, groups.values()))
+        
+        return results
     
     def rename_file(self, source: Path, dest: Path) -> None:
         """
@@ -90,10 +302,12 @@ class FileSystem:
             PathError: If paths are invalid
         """
         try:
-            if not source.exists():
+            try:
+                source_stat = os.stat(source)
+            except FileNotFoundError:
                 raise PathError(f"Source file does not exist: {source}")
             
-            if not source.is_file():
+            if not stat.S_ISREG(source_stat.st_mode):
                 raise PathError(f"Source is not a file: {source}")
             
             # Ensure destination directory exists
@@ -104,10 +318,7 @@ class FileSystem:
         except PermissionError as e:
             raise PermissionError(f"Permission denied: {e}")
         except OSError as e:
-            if e.errno == 13:
-                raise PermissionError(f"Permission denied: {e}")
-            else:
-                raise PathError(f"Path error: {e}")
+            raise _translate_os_error(e) from e
     
     def create_directory(self, path: Path) -> None:
         """
@@ -125,10 +336,7 @@ class FileSystem:
         except PermissionError as e:
             raise PermissionError(f"Permission denied: {e}")
         except OSError as e:
-            if e.errno == 13:
-                raise PermissionError(f"Permission denied: {e}")
-            else:
-                raise PathError(f"Path error: {e}")
+            raise _translate_os_error(e) from e
     
     def list_files(self, directory: Path, pattern: str = "*") -> List[Path]:
         """
@@ -146,23 +354,24 @@ class FileSystem:
             PathError: If directory is invalid
         """
         try:
-            if not directory.exists():
-                raise PathError(f"Directory does not exist: {directory}")
+            # Patterns that reach into subdirectories need a full glob walk
+            if _is_nested_pattern(pattern):
+                self._check_directory(directory)
+                return [f for f in directory.glob(pattern) if f.is_file()]
             
-            if not directory.is_dir():
-                raise PathError(f"Path is not a directory: {directory}")
-            
-            # Use glob to find matching files
-            files = [f for f in directory.glob(pattern) if f.is_file()]
-            return files
+            # Single-level patterns are answered from one scandir pass, using
+            # the cached entry type instead of a second stat per file
+            regex = _compile_glob(pattern, os.name != 'nt')
+            with self._scandir(directory) as entries:
+                return [
+                    Path(entry.path) for entry in entries
+                    if (regex is None or regex.match(entry.name)) and entry.is_file()
+                ]
             
         except PermissionError as e:
             raise PermissionError(f"Permission denied: {e}")
         except OSError as e:
-            if e.errno == 13:
-                raise PermissionError(f"Permission denied: {e}")
-            else:
-                raise PathError(f"Path error: {e}")
+            raise _translate_os_error(e) from e
     
     def get_file_info(self, path: Path) -> FileInfo:
         """
@@ -179,83 +388,231 @@ class FileSystem:
             PathError: If file doesn't exist or is invalid
         """
         try:
-            if not path.exists():
+            try:
+                file_stat = os.stat(path)
+            except FileNotFoundError:
                 raise PathError(f"File does not exist: {path}")
             
-            if not path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise PathError(f"Path is not a file: {path}")
             
-            stat = path.stat()
+            return self._file_info_from_stat(path, file_stat)
             
-            return FileInfo(
-                path=path,
-                size=stat.st_size,
-                modified_time=datetime.fromtimestamp(stat.st_mtime),
-                created_time=datetime.fromtimestamp(stat.st_ctime),
-                extension=path.suffix,
-            )
+        except PermissionError as e:
+            raise PermissionError(f"Permission denied: {e}")
+        except OSError as e:
+            raise _translate_os_error(e) from e
+    
+    def scan_files(self, directory: Path, pattern: str = "*") -> List[FileInfo]:
+        """
+        List files in a directory matching a pattern, with their metadata.
+        
+        Metadata is taken from the directory scan itself (DirEntry.stat),
+        so callers that need it don't pay for a get_file_info call per file.
+        
+        Args:
+            directory: Directory to search
+            pattern: Glob pattern for matching files (default: "*")
+            
+        Returns:
+            List of FileInfo objects for files matching the pattern
+            
+        Raises:
+            PermissionError: If lacking permissions
+            PathError: If directory is invalid
+        """
+        try:
+            # Patterns that reach into subdirectories need a full glob walk
+            if _is_nested_pattern(pattern):
+                self._check_directory(directory)
+                return [
+                    self.get_file_info(f) for f in directory.glob(pattern) if f.is_file()
+                ]
+            
+            regex = _compile_glob(pattern, os.name != 'nt')
+            file_infos = []
+            with self._scandir(directory) as entries:
+                for entry in entries:
+                    if regex is not None and not regex.match(entry.name):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    
+                    try:
+                        entry_stat = entry.stat()
+                    except FileNotFoundError:
+                        # Removed since the directory was read
+                        continue
+                    
+                    file_infos.append(self._file_info_from_stat(Path(entry.path), entry_stat))
+            
+            return file_infos
             
         except PermissionError as e:
             raise PermissionError(f"Permission denied: {e}")
         except OSError as e:
-            if e.errno == 13:
-                raise PermissionError(f"Permission denied: {e}")
-            else:
-                raise PathError(f"Path error: {e}")
+            raise _translate_os_error(e) from e
     
-    def _resolve_conflict(self, dest: Path) -> Path:
+    def _check_directory(self, directory: Path) -> None:
+        """
+        Check that a path exists and is a directory.
+        
+        Args:
+            directory: Path to check
+            
+        Raises:
+            PathError: If the path is missing or not a directory
+        """
+        if not directory.exists():
+            raise PathError(f"Directory does not exist: {directory}")
+        
+        if not directory.is_dir():
+            raise PathError(f"Path is not a directory: {directory}")
+    
+    def _scandir(self, directory: Path):
+        """
+        Open a directory for scanning.
+        
+        Opening the directory is itself the existence and type check, so
+        no separate stat calls are made beforehand.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            Iterator of os.DirEntry objects (usable as a context manager)
+            
+        Raises:
+            PathError: If the path is missing or not a directory
+        """
+        try:
+            return os.scandir(directory)
+        except FileNotFoundError:
+            raise PathError(f"Directory does not exist: {directory}")
+        except NotADirectoryError:
+            raise PathError(f"Path is not a directory: {directory}")
+    
+    def _file_info_from_stat(self, path: Path, file_stat: os.stat_result) -> FileInfo:
+        """
+        Build a FileInfo from an existing stat result.
+        
+        Args:
+            path: File path
+            file_stat: Result of stat() for the file
+            
+        Returns:
+            FileInfo object with file metadata
+        """
+        return FileInfo(
+            path=path,
+            size=file_stat.st_size,
+            modified_time=file_stat.st_mtime,
+            created_time=file_stat.st_ctime,
+            # A handful of distinct extensions repeat across every file,
+            # so share one string object per extension
+            extension=sys.intern(path.suffix),
+        )
+    
+    def _resolve_conflict(self, dest: Path, claimed: AbstractSet[str] = frozenset()) -> Path:
         """
         Resolve filename conflicts by appending numeric suffixes.
         
+        Picks the lowest free suffix (_1, _2, ...), so gaps left by deleted
+        copies are reused. The destination directory is listed once and the
+        candidates are checked against that listing, so a directory holding
+        thousands of numbered copies costs one syscall instead of one per
+        candidate.
+        
         Args:
             dest: Desired destination path
+            claimed: Names to treat as taken even if the listing lacks them
             
         Returns:
             Path with numeric suffix if conflict exists, otherwise original path
         """
-        if not dest.exists():
+        parent = dest.parent
+        
+        if dest.name not in claimed and not dest.exists():
             return dest
         
+        try:
+            existing = set(os.listdir(parent))
+        except FileNotFoundError:
+            existing = set()
+        existing.update(claimed)
+        
         # Extract stem and suffix
         stem = dest.stem
         suffix = dest.suffix
-        parent = dest.parent
         
-        # Try numeric suffixes until we find an available name
         counter = 1
-        while True:
-            new_name = f"{stem}_{counter}{suffix}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return new_path
+        while f"{stem}_{counter}{suffix}" in existing:
             counter += 1
+        
+        return parent / f"{stem}_{counter}{suffix}"
     
-    def _check_disk_space(self, source: Path, dest_dir: Path) -> None:
+    def _check_disk_space(
+        self,
+        source: Path,
+        dest_dir: Path,
+        file_size: Optional[int] = None
+    ) -> None:
         """
         Check if sufficient disk space is available for the operation.
         
         Args:
             source: Source file to be moved
             dest_dir: Destination directory
+            file_size: Size of the source file, if already known
             
         Raises:
             DiskSpaceError: If insufficient disk space
         """
         try:
             # Get file size
-            file_size = source.stat().st_size
+            if file_size is None:
+                file_size = source.stat().st_size
             
             # Get available space on destination
-            stat = os.statvfs(dest_dir if dest_dir.exists() else dest_dir.parent)
-            available_space = stat.f_bavail * stat.f_frsize
+            probe_dir = dest_dir if dest_dir.exists() else dest_dir.parent
+            available_space = self._available_space(probe_dir)
             
             # Check if we have enough space (with 10% buffer)
             required_space = file_size * 1.1
+            if available_space < required_space:
+                # The cached figure may be stale, re-probe before failing
+                available_space = self._available_space(probe_dir, refresh=True)
+            
             if available_space < required_space:
                 raise DiskSpaceError(
                     f"Insufficient disk space. Required: {required_space}, "
                     f"Available: {available_space}"
                 )
+            
+            # Deduct the incoming file so checks between probes stay accurate
+            probed_at, _ = self._statvfs_cache[probe_dir]
+            self._statvfs_cache[probe_dir] = (probed_at, available_space - file_size)
         except OSError as e:
             # If we can't check disk space, log but don't fail
             pass
+    
+    def _available_space(self, directory: Path, refresh: bool = False) -> int:
+        """
+        Get the available space for a directory, reusing recent probes.
+        
+        Args:
+            directory: Directory on the filesystem to probe
+            refresh: If True, ignore any cached value
+            
+        Returns:
+            Available space in bytes
+        """
+        now = time.monotonic()
+        cached = self._statvfs_cache.get(directory)
+        if not refresh and cached is not None and now - cached[0] < self.STATVFS_TTL:
+            return cached[1]
+        
+        fs_stat = os.statvfs(directory)
+        available_space = fs_stat.f_bavail * fs_stat.f_frsize
+        self._statvfs_cache[directory] = (now, available_space)
+        return available_space
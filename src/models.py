@@ -1,11 +1,15 @@
 """Core data models for the File Organizer."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+# Slotted dataclasses drop the per-instance __dict__ but need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class OperationType(Enum):
     """Types of file operations supported by the organizer."""
@@ -23,7 +27,7 @@ class CaseType(Enum):
     TITLE = "title"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Config:
     """Configuration for file organization operations."""
     target_dir: Path
@@ -45,17 +49,17 @@ class Config:
     file_pattern: str = "*"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Operation:
     """Represents a single file operation to be performed or undone."""
     operation_type: OperationType
     source_path: Path
     dest_path: Path
-    timestamp: datetime
+    timestamp: Optional[datetime] = None  # Set as its move starts, even if it fails
     executed: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Rule:
     """Custom organization rule for file matching and categorization."""
     name: str
@@ -64,20 +68,53 @@ class Rule:
     priority: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OperationResults:
     """Results summary from executing file operations."""
-    successful: int
-    skipped: int
-    errors: List[Tuple[Path, str]]  # (file, error_message)
-    operations: List[Operation]
+    successful: int = 0
+    skipped: int = 0
+    errors: List[Tuple[Path, str]] = field(default_factory=list)  # (file, error_message)
+    operations: List[Operation] = field(default_factory=list)
+    
+    def add(self, operation: Operation, error: Optional[str] = None) -> None:
+        """
+        Record the outcome of an operation as soon as it finishes.
+        
+        Args:
+            operation: Operation that was attempted
+            error: Error message if the operation failed, None if it succeeded
+        """
+        self.operations.append(operation)
+        if error is None:
+            self.successful += 1
+        else:
+            self.errors.append((operation.source_path, error))
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class FileInfo:
-    """Metadata information about a file."""
+    """
+    Metadata information about a file.
+    
+    Times are raw epoch seconds as reported by stat; use the ``*_datetime``
+    properties when a datetime object is needed.
+    """
     path: Path
     size: int
-    modified_time: datetime
-    created_time: datetime
+    modified_time: Optional[float]
+    created_time: Optional[float]
     extension: str
+    
+    @property
+    def modified_datetime(self) -> Optional[datetime]:
+        """Modification time as a local datetime, or None if unavailable."""
+        if self.modified_time is None:
+            return None
+        return datetime.fromtimestamp(self.modified_time)
+    
+    @property
+    def created_datetime(self) -> Optional[datetime]:
+        """Creation time as a local datetime, or None if unavailable."""
+        if self.created_time is None:
+            return None
+        return datetime.fromtimestamp(self.created_time)
@@ -1,17 +1,22 @@
 """Orchestrator component for coordinating file operations."""
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Type
 from datetime import datetime
 
 from src.models import (
-    Config, Operation, OperationResults, OperationType, CaseType
+    Config, FileInfo, Operation, OperationResults, OperationType, CaseType
 )
 from src.filesystem import FileSystem, FileSystemError
 from src.renamer import Renamer, RenameError
 from src.organizer import Organizer, OrganizerError
-from src.rule_engine import RuleEngine, RuleEngineError
-from src.undo_manager import UndoManager, UndoManagerError
+
+# The rule engine and the undo manager are imported on first use, so runs
+# that never need them don't pay for loading them
+if TYPE_CHECKING:
+    from src.rule_engine import RuleEngine
+    from src.undo_manager import UndoManager
 
 
 class OrchestratorError(Exception):
@@ -19,16 +24,37 @@ class OrchestratorError(Exception):
     pass
 
 
+def _lazy_component_errors() -> Tuple[Type[Exception], ...]:
+    """
+    Get the exception types of the lazily imported components.
+    
+    Only called once an exception is already being handled, so the imports
+    never happen on the success path.
+    
+    Returns:
+        Tuple of RuleEngineError and UndoManagerError
+    """
+    from src.rule_engine import RuleEngineError
+    from src.undo_manager import UndoManagerError
+    return (RuleEngineError, UndoManagerError)
+
+
 class Orchestrator:
     """Coordinates all file organization operations and manages workflow."""
     
+    # Batches at least this large are moved on a thread pool
+    PARALLEL_THRESHOLD = 32
+    
+    # Worker threads for parallel moves; moves are I/O-bound, not CPU-bound
+    MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     def __init__(
         self,
         filesystem: Optional[FileSystem] = None,
         renamer: Optional[Renamer] = None,
         organizer: Optional[Organizer] = None,
-        rule_engine: Optional[RuleEngine] = None,
-        undo_manager: Optional[UndoManager] = None
+        rule_engine: Optional["RuleEngine"] = None,
+        undo_manager: Optional["UndoManager"] = None
     ):
         """
         Initialize the Orchestrator with component dependencies.
@@ -37,14 +63,38 @@ class Orchestrator:
             filesystem: FileSystem instance (optional, creates new if not provided)
             renamer: Renamer instance (optional, creates new if not provided)
             organizer: Organizer instance (optional, creates new if not provided)
-            rule_engine: RuleEngine instance (optional, creates new if not provided)
-            undo_manager: UndoManager instance (optional, creates new if not provided)
+            rule_engine: RuleEngine instance (optional, created on first use if not provided)
+            undo_manager: UndoManager instance (optional, created on first use if not provided)
         """
         self.filesystem = filesystem or FileSystem()
         self.renamer = renamer or Renamer()
         self.organizer = organizer or Organizer(self.filesystem)
-        self.rule_engine = rule_engine or RuleEngine()
-        self.undo_manager = undo_manager or UndoManager(self.filesystem)
+        self._rule_engine = rule_engine
+        self._undo_manager = undo_manager
+        
+        # Planner for each operation type, resolved once per orchestrator
+        self._planners = {
+            OperationType.RENAME: self._plan_rename_operations,
+            OperationType.ORGANIZE_TYPE: self._plan_organize_type,
+            OperationType.ORGANIZE_DATE: self._plan_organize_date,
+            OperationType.CUSTOM: self._plan_custom,
+        }
+    
+    @property
+    def rule_engine(self) -> "RuleEngine":
+        """RuleEngine used for custom operations, created on first use."""
+        if self._rule_engine is None:
+            from src.rule_engine import RuleEngine
+            self._rule_engine = RuleEngine()
+        return self._rule_engine
+    
+    @property
+    def undo_manager(self) -> "UndoManager":
+        """UndoManager used to log executed operations, created on first use."""
+        if self._undo_manager is None:
+            from src.undo_manager import UndoManager
+            self._undo_manager = UndoManager(self.filesystem)
+        return self._undo_manager
     
     def execute(self, config: Config) -> OperationResults:
         """
@@ -65,16 +115,14 @@ class Orchestrator:
             # Phase 1: Plan operations
             operations = self.plan_operations(config)
             
-            # Phase 2: Execute operations (or simulate in dry-run mode)
-            results = self.execute_operations(operations, config.dry_run)
+            # Phase 2: Execute operations (or simulate in dry-run mode),
+            # logging each executed operation for undo as it completes
+            results = self.execute_operations(
+                operations, config.dry_run, log_undo=not config.dry_run
+            )
             
-            # Phase 3: Log operations for undo (only if not dry-run and successful)
+            # Phase 3: Save the undo log (only if not dry-run and successful)
             if not config.dry_run and results.successful > 0:
-                # Log all executed operations
-                for operation in results.operations:
-                    if operation.executed:
-                        self.undo_manager.log_operation(operation)
-                
                 # Save the undo log
                 self.undo_manager.save_log()
                 
@@ -83,8 +131,12 @@ class Orchestrator:
             
             return results
             
-        except (FileSystemError, RenameError, OrganizerError, RuleEngineError, UndoManagerError) as e:
+        except (FileSystemError, RenameError, OrganizerError) as e:
             raise OrchestratorError(f"Operation failed: {e}")
+        except Exception as e:
+            if isinstance(e, _lazy_component_errors()):
+                raise OrchestratorError(f"Operation failed: {e}")
+            raise
     
     def plan_operations(self, config: Config) -> List[Operation]:
         """
@@ -102,41 +154,71 @@ class Orchestrator:
         Raises:
             OrchestratorError: If planning fails
         """
-        # Get list of files to process
-        files = self.filesystem.list_files(config.target_dir, config.file_pattern)
+        # Get list of files to process; date organization needs metadata,
+        # so take it from the directory scan rather than stat'ing each file
+        if config.operation_type == OperationType.ORGANIZE_DATE:
+            files = self.filesystem.scan_files(config.target_dir, config.file_pattern)
+        else:
+            files = self.filesystem.list_files(config.target_dir, config.file_pattern)
         
         if not files:
             return []
         
         # Generate operations based on operation type
-        operations = []
+        planner = self._planners.get(config.operation_type)
         
-        if config.operation_type == OperationType.RENAME:
-            operations = self._plan_rename_operations(config, files)
-        
-        elif config.operation_type == OperationType.ORGANIZE_TYPE:
-            operations = self.organizer.organize_by_type(files, config.target_dir)
+        if planner is None:
+            if config.operation_type == OperationType.UNDO:
+                # Undo operations are handled differently (not planned)
+                raise OrchestratorError("Undo operations should use undo_manager directly")
+            raise OrchestratorError(f"Unknown operation type: {config.operation_type}")
         
-        elif config.operation_type == OperationType.ORGANIZE_DATE:
-            date_format = config.date_format or "YYYY/MM"
-            operations = self.organizer.organize_by_date(files, config.target_dir, date_format)
+        return planner(config, files)
+    
+    def _plan_organize_type(self, config: Config, files: List[Path]) -> List[Operation]:
+        """
+        Plan organize-by-type operations.
         
-        elif config.operation_type == OperationType.CUSTOM:
-            if not config.rules_file:
-                raise OrchestratorError("Custom operation requires a rules file")
+        Args:
+            config: Configuration for the operation
+            files: List of files to organize
             
-            # Load rules from configuration file
-            rules = self.rule_engine.load_rules(config.rules_file)
-            operations = self.rule_engine.apply_rules(files, rules, config.target_dir)
+        Returns:
+            List of Operation objects for the organization
+        """
+        return self.organizer.organize_by_type(files, config.target_dir)
+    
+    def _plan_organize_date(self, config: Config, files: List[FileInfo]) -> List[Operation]:
+        """
+        Plan organize-by-date operations.
         
-        elif config.operation_type == OperationType.UNDO:
-            # Undo operations are handled differently (not planned)
-            raise OrchestratorError("Undo operations should use undo_manager directly")
+        Args:
+            config: Configuration with date-specific options
+            files: FileInfo objects for the files to organize
+            
+        Returns:
+            List of Operation objects for the organization
+        """
+        date_format = config.date_format or "YYYY/MM"
+        return self.organizer.organize_by_date(files, config.target_dir, date_format)
+    
+    def _plan_custom(self, config: Config, files: List[Path]) -> List[Operation]:
+        """
+        Plan operations from a custom rules file.
         
-        else:
-            raise OrchestratorError(f"Unknown operation type: {config.operation_type}")
+        Args:
+            config: Configuration with the rules file
+            files: List of files to match against the rules
+            
+        Returns:
+            List of Operation objects for files that matched a rule
+        """
+        if not config.rules_file:
+            raise OrchestratorError("Custom operation requires a rules file")
         
-        return operations
+        # Load rules from configuration file
+        rules = self.rule_engine.load_rules(config.rules_file)
+        return self.rule_engine.apply_rules(files, rules, config.target_dir)
     
     def _plan_rename_operations(self, config: Config, files: List[Path]) -> List[Operation]:
         """
@@ -176,76 +258,139 @@ class Orchestrator:
     
     def execute_operations(
         self, 
-        operations: List[Operation], 
-        dry_run: bool = False
+        operations: Iterable[Operation], 
+        dry_run: bool = False,
+        log_undo: bool = False
     ) -> OperationResults:
         """
         Execute or simulate a list of operations.
         
         Args:
-            operations: List of Operation objects to execute
+            operations: Operation objects to execute, consumed in a single pass
             dry_run: If True, simulate operations without modifying files
+            log_undo: If True, record each executed operation with the undo manager
             
         Returns:
             OperationResults with summary of execution
         """
-        successful = 0
-        skipped = 0
-        errors = []
+        results = OperationResults()
+        
+        if dry_run:
+            # Simulated operations share the time of the simulation
+            now = datetime.now()
+            
+            for operation in operations:
+                # In dry-run mode, just mark as "would be executed"
+                # Don't actually modify the file system
+                operation.timestamp = now
+                operation.executed = False
+                results.add(operation)
+            
+            return results
         
-        for operation in operations:
+        operations = list(operations)
+        self._create_directories(operations)
+        
+        # Execute the actual operations; errors come back as messages so
+        # failures are recorded and the remaining operations continue
+        if len(operations) >= self.PARALLEL_THRESHOLD:
+            errors = self._execute_parallel(operations)
+        else:
+            errors = map(self._execute_single_operation, operations)
+        
+        for operation, error in zip(operations, errors):
+            if error is None:
+                operation.executed = True
+                
+                if log_undo:
+                    self.undo_manager.log_operation(operation)
+            
+            results.add(operation, error)
+        
+        return results
+    
+    def _create_directories(self, operations: List[Operation]) -> None:
+        """
+        Create every destination directory of a batch up front.
+        
+        Each unique directory is created once, parents before children, so
+        the moves that follow find their directories in place. move_file
+        still calls mkdir(exist_ok=True) per move, which is then a cheap
+        no-op; it is kept so a directory that failed to be created here
+        surfaces as that operation's error.
+        
+        Args:
+            operations: Operations about to be executed
+        """
+        dest_dirs = {operation.dest_path.parent for operation in operations}
+        
+        for dest_dir in sorted(dest_dirs, key=lambda path: len(path.parts)):
             try:
-                if dry_run:
-                    # In dry-run mode, just mark as "would be executed"
-                    # Don't actually modify the file system
-                    operation.executed = False
-                    successful += 1
-                else:
-                    # Execute the actual operation
-                    self._execute_single_operation(operation)
-                    operation.executed = True
-                    successful += 1
-                    
-            except FileSystemError as e:
-                # Log error and continue with remaining operations
-                errors.append((operation.source_path, str(e)))
-            except Exception as e:
-                # Catch unexpected errors
-                errors.append((operation.source_path, f"Unexpected error: {e}"))
-        
-        return OperationResults(
-            successful=successful,
-            skipped=skipped,
-            errors=errors,
-            operations=operations
+                self.filesystem.create_directory(dest_dir)
+            except FileSystemError:
+                # Reported per operation by the moves into this directory
+                pass
+    
+    def _execute_parallel(self, operations: List[Operation]) -> List[Optional[str]]:
+        """
+        Execute a large batch of operations on a thread pool.
+        
+        Every operation type is carried out by moving the source file (undo
+        moves it back), so the batch is handed to FileSystem.batch_move,
+        which keeps moves into the same directory in order and falls back
+        to plan order when moves in different directories depend on each
+        other.
+        
+        Args:
+            operations: Operations to execute
+            
+        Returns:
+            One entry per operation, in order: None if it succeeded,
+            otherwise an error message
+        """
+        def stamp(idx: int) -> None:
+            # Same meaning as the serial path: the time its move started
+            operations[idx].timestamp = datetime.now()
+        
+        errors = self.filesystem.batch_move(
+            [(operation.source_path, operation.dest_path) for operation in operations],
+            workers=self.MOVE_WORKERS,
+            before_move=stamp
         )
+        
+        return [
+            None if error is None else self._error_message(error)
+            for error in errors
+        ]
+    
+    def _error_message(self, error: Exception) -> str:
+        """
+        Describe a failed operation for OperationResults.
+        
+        Args:
+            error: Exception raised while executing the operation
+            
+        Returns:
+            Error message, flagging errors that did not come from the filesystem
+        """
+        if isinstance(error, FileSystemError):
+            return str(error)
+        return f"Unexpected error: {error}"
     
-    def _execute_single_operation(self, operation: Operation) -> None:
+    def _execute_single_operation(self, operation: Operation) -> Optional[str]:
         """
         Execute a single file operation.
         
         Args:
             operation: Operation to execute
             
-        Raises:
-            FileSystemError: If operation fails
-        """
-        # Ensure destination directory exists
-        self.filesystem.create_directory(operation.dest_path.parent)
-        
-        # Execute based on operation type
-        if operation.operation_type in [
-            OperationType.RENAME,
-            OperationType.ORGANIZE_TYPE,
-            OperationType.ORGANIZE_DATE,
-            OperationType.CUSTOM
-        ]:
-            # All these operations involve moving/renaming files
-            self.filesystem.move_file(operation.source_path, operation.dest_path)
-        
-        elif operation.operation_type == OperationType.UNDO:
-            # Undo operations also move files (back to original location)
+        Returns:
+            None if the operation succeeded, otherwise an error message
+        """
+        try:
+            operation.timestamp = datetime.now()
             self.filesystem.move_file(operation.source_path, operation.dest_path)
+        except Exception as e:
+            return self._error_message(e)
         
-        else:
-            raise OrchestratorError(f"Unknown operation type: {operation.operation_type}")
+        return None
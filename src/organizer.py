@@ -1,10 +1,10 @@
 """Organizer component for file categorization and organization."""
 
+import time
 from pathlib import Path
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Tuple, Union
 
-from src.models import Operation, OperationType
+from src.models import FileInfo, Operation, OperationType
 from src.filesystem import FileSystem
 
 
@@ -26,6 +26,19 @@ class Organizer:
         'code': ['.py', '.js', '.java', '.cpp', '.c', '.h', '.cs', '.php', '.rb', '.go', '.rs', '.ts', '.html', '.css', '.json', '.xml', '.yaml', '.yml', '.sh', '.bat']
     }
     
+    # Reverse index of FILE_TYPE_CATEGORIES for constant-time lookups
+    _EXT_TO_CATEGORY: Dict[str, str] = {
+        ext: category
+        for category, extensions in FILE_TYPE_CATEGORIES.items()
+        for ext in extensions
+    }
+    
+    # strftime formats for the supported date folder layouts
+    DATE_FOLDER_FORMATS: Dict[str, str] = {
+        'YYYY/MM': '%Y/%m',
+        'YYYY-MM': '%Y-%m',
+    }
+    
     def __init__(self, filesystem: FileSystem = None):
         """
         Initialize the Organizer.
@@ -47,13 +60,14 @@ class Organizer:
             List of Operation objects for the organization operations
         """
         operations = []
+        ext_to_category = self._EXT_TO_CATEGORY
         
         for file_path in files:
             # Get file extension
             extension = file_path.suffix.lower()
             
-            # Determine category
-            category = self._get_category(extension)
+            # Determine category (extension is already lowercased)
+            category = ext_to_category.get(extension, 'other')
             
             # Create destination path
             dest_dir = target_dir / category
@@ -64,7 +78,6 @@ class Organizer:
                 operation_type=OperationType.ORGANIZE_TYPE,
                 source_path=file_path,
                 dest_path=dest_path,
-                timestamp=datetime.now(),
                 executed=False
             )
             operations.append(operation)
@@ -73,7 +86,7 @@ class Organizer:
     
     def organize_by_date(
         self, 
-        files: List[Path], 
+        files: List[Union[Path, FileInfo]], 
         target_dir: Path, 
         date_format: str = "YYYY/MM"
     ) -> List[Operation]:
@@ -81,7 +94,8 @@ class Organizer:
         Organize files by modification date into year/month folder structures.
         
         Args:
-            files: List of file paths to organize
+            files: List of file paths to organize, or FileInfo objects when
+                   metadata was already gathered (e.g. by FileSystem.scan_files)
             target_dir: Target directory where date subdirectories will be created
             date_format: Format for date folders ("YYYY/MM" or "YYYY-MM")
             
@@ -90,26 +104,35 @@ class Organizer:
         """
         operations = []
         
-        for file_path in files:
-            # Get file info to access dates
-            file_info = self.filesystem.get_file_info(file_path)
+        # Resolve the folder format once; unknown formats default to YYYY/MM
+        folder_format = self.DATE_FOLDER_FORMATS.get(date_format, '%Y/%m')
+        
+        # Destination directory for each (year, month) seen so far
+        date_dirs: Dict[Tuple[int, int], Path] = {}
+        
+        for file in files:
+            # Get file info to access dates, unless the caller already has it
+            if isinstance(file, FileInfo):
+                file_info = file
+            else:
+                file_info = self.filesystem.get_file_info(file)
+            file_path = file_info.path
             
             # Use modification time, fallback to creation time if unavailable
-            file_date = file_info.modified_time
-            if file_date is None:
-                file_date = file_info.created_time
+            file_time = file_info.modified_time
+            if file_time is None:
+                file_time = file_info.created_time
             
-            # Format the date folder path
-            if date_format == "YYYY/MM":
-                date_folder = f"{file_date.year}/{file_date.month:02d}"
-            elif date_format == "YYYY-MM":
-                date_folder = f"{file_date.year}-{file_date.month:02d}"
-            else:
-                # Default to YYYY/MM
-                date_folder = f"{file_date.year}/{file_date.month:02d}"
+            # Files from the same local month share one destination directory,
+            # so the folder is only formatted the first time a month is seen
+            local_time = time.localtime(file_time)
+            month_key = (local_time.tm_year, local_time.tm_mon)
+            dest_dir = date_dirs.get(month_key)
+            if dest_dir is None:
+                date_folder = time.strftime(folder_format, local_time)
+                dest_dir = date_dirs[month_key] = target_dir / date_folder
             
             # Create destination path (preserve filename)
-            dest_dir = target_dir / date_folder
             dest_path = dest_dir / file_path.name
             
             # Create operation
@@ -117,7 +140,6 @@ class Organizer:
                 operation_type=OperationType.ORGANIZE_DATE,
                 source_path=file_path,
                 dest_path=dest_path,
-                timestamp=datetime.now(),
                 executed=False
             )
             operations.append(operation)
@@ -154,11 +176,5 @@ class Organizer:
             Category name (e.g., 'documents', 'images', etc.)
             Returns 'other' if extension doesn't match any category
         """
-        extension = extension.lower()
-        
-        for category, extensions in self.FILE_TYPE_CATEGORIES.items():
-            if extension in extensions:
-                return category
-        
         # Default category for unknown extensions
-        return 'other'
+        return self._EXT_TO_CATEGORY.get(extension.lower(), 'other')
@@ -1,13 +1,30 @@
 """Renamer component for file renaming operations."""
 
 import re
+from collections import Counter
 from pathlib import Path
-from typing import List, Set
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+from src.filesystem import list_names
 from src.models import Operation, OperationType, CaseType
 
 
+def _split_name(name: str) -> Tuple[str, str]:
+    """
+    Split a filename into stem and extension, like Path.stem and Path.suffix.
+    
+    Args:
+        name: Filename without any directory part
+        
+    Returns:
+        Tuple of (stem, extension), with an empty extension if there is none
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ''
+
+
 class RenameError(Exception):
     """Base exception for rename operations."""
     pass
@@ -21,6 +38,13 @@ class DuplicateNameError(RenameError):
 class Renamer:
     """Handles all filename transformation logic."""
     
+    # Stem transformation for each case type
+    CASE_TRANSFORMS: Dict[CaseType, Callable[[str], str]] = {
+        CaseType.LOWERCASE: str.lower,
+        CaseType.UPPERCASE: str.upper,
+        CaseType.TITLE: str.title,
+    }
+    
     def rename_pattern(
         self, 
         files: List[Path], 
@@ -41,52 +65,54 @@ class Renamer:
         Raises:
             DuplicateNameError: If renaming would create duplicate filenames
         """
-        operations = []
-        new_names: Set[str] = set()
-        duplicates: List[str] = []
-        
+        # Compute every new name first (None if the new stem would be empty),
+        # applying the replacement to the stem only to preserve the extension
+        candidates: List[Tuple[Path, str, Optional[str]]] = []
         for file_path in files:
-            # Get the filename without path
             original_name = file_path.name
-            stem = file_path.stem
-            extension = file_path.suffix
-            
-            # Apply pattern replacement to stem only (preserve extension)
+            stem, extension = _split_name(original_name)
             new_stem = stem.replace(pattern, replacement)
-            
-            # Skip if new stem is empty (invalid filename)
-            if not new_stem:
+            candidates.append(
+                (file_path, original_name, new_stem + extension if new_stem else None)
+            )
+        
+        # A new name is a duplicate if several files in the batch map to it
+        # or if it already exists on disk; each parent is listed only once
+        name_counts = Counter(new_name for _, _, new_name in candidates)
+        sibling_names: Dict[Path, Set[str]] = {}
+        duplicates: List[str] = []
+        
+        for file_path, original_name, new_name in candidates:
+            if new_name is None or name_counts[new_name] > 1:
                 duplicates.append(original_name)
                 continue
             
-            new_name = new_stem + extension
-            
-            # Check for duplicates
-            new_path = file_path.parent / new_name
-            
-            if new_name in new_names or (new_path.exists() and new_path != file_path):
-                duplicates.append(original_name)
-            else:
-                new_names.add(new_name)
+            if new_name != original_name:
+                parent = file_path.parent
+                existing = sibling_names.get(parent)
+                if existing is None:
+                    existing = sibling_names[parent] = list_names(parent)
                 
-                # Only create operation if name actually changed
-                if new_name != original_name:
-                    operation = Operation(
-                        operation_type=OperationType.RENAME,
-                        source_path=file_path,
-                        dest_path=new_path,
-                        timestamp=datetime.now(),
-                        executed=False
-                    )
-                    operations.append(operation)
-        
-        # If duplicates found, raise error
+                if new_name in existing:
+                    duplicates.append(original_name)
+        
+        # If duplicates found, raise error before building any operations
         if duplicates:
             raise DuplicateNameError(
                 f"Rename would create duplicate filenames: {', '.join(duplicates)}"
             )
         
-        return operations
+        # Only create operations for names that actually changed
+        return [
+            Operation(
+                operation_type=OperationType.RENAME,
+                source_path=file_path,
+                dest_path=file_path.parent / new_name,
+                executed=False
+            )
+            for file_path, original_name, new_name in candidates
+            if new_name != original_name
+        ]
     
     def rename_sequential(
         self, 
@@ -106,11 +132,15 @@ class Renamer:
         """
         operations = []
         
+        # Split the template once; joining the parts around each number
+        # fills every {n} placeholder without rescanning the template
+        template_parts = template.split('{n}')
+        
         for idx, file_path in enumerate(files, start=1):
-            extension = file_path.suffix
+            _, extension = _split_name(file_path.name)
             
             # Replace {n} placeholder with sequential number
-            new_stem = template.replace('{n}', str(idx))
+            new_stem = str(idx).join(template_parts)
             new_name = new_stem + extension
             new_path = file_path.parent / new_name
             
@@ -118,7 +148,6 @@ class Renamer:
                 operation_type=OperationType.RENAME,
                 source_path=file_path,
                 dest_path=new_path,
-                timestamp=datetime.now(),
                 executed=False
             )
             operations.append(operation)
@@ -142,30 +171,24 @@ class Renamer:
         """
         operations = []
         
-        for file_path in files:
-            stem = file_path.stem
-            extension = file_path.suffix
-            
-            # Apply case transformation to stem only
-            if case_type == CaseType.LOWERCASE:
-                new_stem = stem.lower()
-            elif case_type == CaseType.UPPERCASE:
-                new_stem = stem.upper()
-            elif case_type == CaseType.TITLE:
-                new_stem = stem.title()
-            else:
-                new_stem = stem
-            
+        # Resolve the transformation once for the whole batch
+        transform = self.CASE_TRANSFORMS.get(case_type)
+        
+        # Apply case transformation to stems only, in a single map() pass
+        names = [file_path.name for file_path in files]
+        split_names = [_split_name(name) for name in names]
+        stems = [stem for stem, _ in split_names]
+        new_stems = map(transform, stems) if transform else stems
+        
+        for file_path, name, (_, extension), new_stem in zip(files, names, split_names, new_stems):
             new_name = new_stem + extension
-            new_path = file_path.parent / new_name
             
             # Only create operation if name actually changed
-            if new_name != file_path.name:
+            if new_name != name:
                 operation = Operation(
                     operation_type=OperationType.RENAME,
                     source_path=file_path,
-                    dest_path=new_path,
-                    timestamp=datetime.now(),
+                    dest_path=file_path.with_name(new_name),
                     executed=False
                 )
                 operations.append(operation)
@@ -192,21 +215,19 @@ class Renamer:
         operations = []
         
         for file_path in files:
-            stem = file_path.stem
-            extension = file_path.suffix
+            name = file_path.name
+            stem, extension = _split_name(name)
             
             # Add prefix and suffix
             new_stem = prefix + stem + suffix
             new_name = new_stem + extension
-            new_path = file_path.parent / new_name
             
             # Only create operation if name actually changed
-            if new_name != file_path.name:
+            if new_name != name:
                 operation = Operation(
                     operation_type=OperationType.RENAME,
                     source_path=file_path,
-                    dest_path=new_path,
-                    timestamp=datetime.now(),
+                    dest_path=file_path.parent / new_name,
                     executed=False
                 )
                 operations.append(operation)
@@ -1,14 +1,119 @@
 """Rule Engine for custom file organization rules."""
 
+import fnmatch
+import functools
 import json
-import yaml
+import logging
+import os
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from fnmatch import fnmatch
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from src.models import Rule, Operation, OperationType
-from datetime import datetime
+from src.rules_cache import RulesCache, default_rules_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_yaml(content: str) -> Any:
+    """
+    Parse YAML text with the safe loader, preferring the C implementation.
+    
+    PyYAML is imported here rather than at module level, so JSON rules files
+    and rule matching never pay for loading it.
+    
+    Args:
+        content: YAML text
+        
+    Returns:
+        Parsed data
+        
+    Raises:
+        RuleEngineError: If the text is not valid YAML
+    """
+    import yaml
+    
+    # Use libyaml's C parser when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        return yaml.load(content, Loader=loader)
+    except yaml.YAMLError as e:
+        raise RuleEngineError(f"Failed to parse configuration file: {e}")
+
+
+# Glob patterns follow fnmatch's platform rules: case-insensitive on Windows
+_GLOB_FLAGS = re.IGNORECASE if os.name == 'nt' else 0
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_rule_pattern(pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a rule pattern once so matching never re-parses it.
+    
+    Args:
+        pattern: Rule pattern, either a glob or a 'regex:'-prefixed expression
+        
+    Returns:
+        Compiled regular expression, or None if a 'regex:' pattern is invalid
+    """
+    if pattern.startswith('regex:'):
+        try:
+            return re.compile(pattern[6:])
+        except re.error:
+            return None
+    
+    return re.compile(fnmatch.translate(pattern), _GLOB_FLAGS)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_combined_pattern(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Fuse rule patterns into one alternation so a file is matched in one call.
+    
+    Each pattern becomes its own capture group, in order, so the index of
+    the group that matched (match.lastindex) identifies the first matching
+    rule. Patterns with groups of their own would shift that index, and
+    regexes with global flags would change the other patterns' meaning, so
+    neither can be fused. This includes globs: before Python 3.11,
+    fnmatch.translate wraps multi-star globs in named groups.
+    
+    Args:
+        patterns: Rule patterns in priority order
+        
+    Returns:
+        Combined regular expression, or None if there are no patterns or
+        they can't be fused
+    """
+    if not patterns:
+        return None
+    
+    default_flags = re.compile('').flags
+    alternatives = []
+    
+    for pattern in patterns:
+        compiled = _compile_rule_pattern(pattern)
+        
+        if compiled is None:
+            # Invalid regex: keep its group so indexes line up, never match
+            alternatives.append('((?!))')
+        elif compiled.groups:
+            return None
+        elif pattern.startswith('regex:'):
+            if compiled.flags != default_flags:
+                return None
+            alternatives.append(f'({compiled.pattern})')
+        else:
+            # Cached translation; group-free, since grouped ones returned above
+            glob = compiled.pattern
+            if _GLOB_FLAGS:
+                glob = f'(?i:{glob})'
+            alternatives.append(f'({glob})')
+    
+    try:
+        return re.compile('|'.join(alternatives))
+    except re.error:
+        return None
 
 
 class RuleEngineError(Exception):
@@ -24,9 +129,15 @@ class InvalidRuleError(RuleEngineError):
 class RuleEngine:
     """Handles parsing and application of custom organization rules."""
     
-    def __init__(self):
-        """Initialize the Rule Engine."""
+    def __init__(self, rules_cache: Optional[RulesCache] = None):
+        """
+        Initialize the Rule Engine.
+        
+        Args:
+            rules_cache: Cache of parsed configuration files (optional, uses the shared cache if not provided)
+        """
         self.rules: List[Rule] = []
+        self.rules_cache = rules_cache or default_rules_cache
     
     def load_rules(self, config_path: Path) -> List[Rule]:
         """
@@ -42,59 +153,56 @@ class RuleEngine:
             RuleEngineError: If file cannot be read or parsed
             InvalidRuleError: If rules have invalid syntax
         """
+        if not config_path.exists():
+            raise RuleEngineError(f"Configuration file not found: {config_path}")
+        
+        # Parse based on file extension, reusing parses of an unchanged file
+        if config_path.suffix in ['.yaml', '.yml']:
+            parse, persist = _parse_yaml, True
+        elif config_path.suffix == '.json':
+            parse, persist = json.loads, False
+        else:
+            raise RuleEngineError(
+                f"Unsupported configuration format: {config_path.suffix}. "
+                "Use .yaml, .yml, or .json"
+            )
+        
         try:
-            if not config_path.exists():
-                raise RuleEngineError(f"Configuration file not found: {config_path}")
-            
-            # Read file content
-            with open(config_path, 'r') as f:
-                content = f.read()
-            
-            # Parse based on file extension
-            if config_path.suffix in ['.yaml', '.yml']:
-                data = yaml.safe_load(content)
-            elif config_path.suffix == '.json':
-                data = json.loads(content)
-            else:
-                raise RuleEngineError(
-                    f"Unsupported configuration format: {config_path.suffix}. "
-                    "Use .yaml, .yml, or .json"
-                )
-            
-            # Extract rules from data
-            if not isinstance(data, dict) or 'rules' not in data:
-                raise InvalidRuleError(
-                    "Configuration must contain a 'rules' key with a list of rules"
-                )
-            
-            rules_data = data['rules']
-            if not isinstance(rules_data, list):
-                raise InvalidRuleError("'rules' must be a list")
-            
-            # Parse each rule
-            rules = []
-            errors = []
-            
-            for idx, rule_data in enumerate(rules_data):
-                try:
-                    rule = self._parse_rule(rule_data, idx)
-                    rules.append(rule)
-                except InvalidRuleError as e:
-                    errors.append(f"Rule {idx}: {str(e)}")
-            
-            # Report errors but continue with valid rules
-            if errors:
-                error_msg = "\n".join(errors)
-                # Store errors but don't raise - continue with valid rules
-                print(f"Warning: Invalid rules found:\n{error_msg}")
-            
-            self.rules = rules
-            return rules
-            
-        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            data = self.rules_cache.load(config_path, parse, persist=persist)
+        except json.JSONDecodeError as e:
             raise RuleEngineError(f"Failed to parse configuration file: {e}")
         except IOError as e:
             raise RuleEngineError(f"Failed to read configuration file: {e}")
+        
+        # Extract rules from data
+        if not isinstance(data, dict) or 'rules' not in data:
+            raise InvalidRuleError(
+                "Configuration must contain a 'rules' key with a list of rules"
+            )
+        
+        rules_data = data['rules']
+        if not isinstance(rules_data, list):
+            raise InvalidRuleError("'rules' must be a list")
+        
+        # Parse each rule
+        rules = []
+        errors = []
+        
+        for idx, rule_data in enumerate(rules_data):
+            try:
+                rule = self._parse_rule(rule_data, idx)
+                rules.append(rule)
+            except InvalidRuleError as e:
+                errors.append(f"Rule {idx}: {str(e)}")
+        
+        # Report errors but continue with valid rules
+        if errors:
+            error_msg = "\n".join(errors)
+            # Store errors but don't raise - continue with valid rules
+            logger.warning("Invalid rules found:\n%s", error_msg)
+        
+        self.rules = rules
+        return rules
     
     def _parse_rule(self, rule_data: Dict[str, Any], index: int) -> Rule:
         """
@@ -156,6 +264,10 @@ class RuleEngine:
         """
         Check if a file matches a rule's pattern.
         
+        Glob patterns must match the whole filename; 'regex:' patterns only
+        need to match at its start (re.match semantics). Invalid regex
+        patterns are rejected by load_rules and never match here.
+        
         Args:
             file: File path to check
             rule: Rule to match against
@@ -163,19 +275,13 @@ class RuleEngine:
         Returns:
             True if file matches the rule pattern, False otherwise
         """
-        filename = file.name
+        compiled = _compile_rule_pattern(rule.pattern)
         
-        # Check if pattern is regex (starts with 'regex:')
-        if rule.pattern.startswith('regex:'):
-            regex_pattern = rule.pattern[6:]  # Remove 'regex:' prefix
-            try:
-                return bool(re.match(regex_pattern, filename))
-            except re.error:
-                # Invalid regex, skip this rule
-                return False
-        else:
-            # Use glob pattern matching
-            return fnmatch(filename, rule.pattern)
+        # Invalid regex, skip this rule
+        if compiled is None:
+            return False
+        
+        return compiled.match(file.name) is not None
     
     def apply_rules(
         self, 
@@ -198,34 +304,64 @@ class RuleEngine:
         
         # Sort rules by priority (lower priority number = higher priority)
         sorted_rules = sorted(rules, key=lambda r: r.priority)
+        match_rule = self._rule_matcher(sorted_rules)
         
-        # Track which files have been matched (first match wins)
-        matched_files = set()
+        # Destination directory of each rule, built once rather than per file
+        dest_dirs = [target_dir / rule.destination for rule in sorted_rules]
         
         for file_path in files:
-            # Skip if already matched
-            if file_path in matched_files:
-                continue
-            
-            # Try to match against rules in priority order
-            for rule in sorted_rules:
-                if self.match_file(file_path, rule):
-                    # Create destination path
-                    dest_dir = target_dir / rule.destination
-                    dest_path = dest_dir / file_path.name
-                    
-                    # Create operation
-                    operation = Operation(
-                        operation_type=OperationType.CUSTOM,
-                        source_path=file_path,
-                        dest_path=dest_path,
-                        timestamp=datetime.now(),
-                        executed=False
-                    )
-                    operations.append(operation)
-                    
-                    # Mark as matched (first match wins)
-                    matched_files.add(file_path)
-                    break  # Stop checking rules for this file
+            # Find the first rule in priority order that matches (first match wins)
+            rule_index = match_rule(file_path)
+            if rule_index is not None:
+                # Create destination path
+                dest_path = dest_dirs[rule_index] / file_path.name
+                
+                # Create operation
+                operation = Operation(
+                    operation_type=OperationType.CUSTOM,
+                    source_path=file_path,
+                    dest_path=dest_path,
+                    executed=False
+                )
+                operations.append(operation)
         
         return operations
+    
+    def _rule_matcher(self, sorted_rules: List[Rule]) -> Callable[[Path], Optional[int]]:
+        """
+        Build a function finding the first rule that matches a file.
+        
+        Uses a single combined regular expression when the rules' patterns
+        can be fused, otherwise tries each rule's compiled pattern in turn.
+        
+        Args:
+            sorted_rules: Rules in priority order
+            
+        Returns:
+            Function mapping a file path to the index of its first matching
+            rule in sorted_rules, or None
+        """
+        combined = _compile_combined_pattern(tuple(rule.pattern for rule in sorted_rules))
+        
+        if combined is None:
+            # Bind each rule's match method once; invalid regexes never match
+            matchers = [
+                (index, compiled.match)
+                for index, compiled in enumerate(
+                    _compile_rule_pattern(rule.pattern) for rule in sorted_rules
+                )
+                if compiled is not None
+            ]
+            
+            def match_rule(file: Path) -> Optional[int]:
+                name = file.name
+                for index, match in matchers:
+                    if match(name):
+                        return index
+                return None
+        else:
+            def match_rule(file: Path) -> Optional[int]:
+                match = combined.match(file.name)
+                return match.lastindex - 1 if match else None
+        
+        return match_rule
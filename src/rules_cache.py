@@ -0,0 +1,152 @@
+"""Cache of parsed rules configuration files."""
+
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+
+# Maximum number of parsed files kept in memory and on disk
+MAX_ENTRIES = 100
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default directory for persisted rules caches.
+    
+    Returns:
+        $XDG_CACHE_HOME/file-organizer, or ~/.cache/file-organizer
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        return Path(base) / "file-organizer"
+    return Path.home() / ".cache" / "file-organizer"
+
+
+class RulesCache:
+    """
+    LRU cache of parsed configuration data keyed by absolute file path.
+    
+    Entries are only reused while the file's mtime and size are unchanged.
+    When a cache directory is given, parsed data is also persisted there as
+    JSON so later processes can skip parsing the original file.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize the RulesCache.
+        
+        Args:
+            cache_dir: Directory for persisted entries (optional, memory-only if not provided)
+            max_entries: Maximum number of entries to keep
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+    
+    def load(self, config_path: Path, parse: Callable[[str], Any], persist: bool = False) -> Any:
+        """
+        Get the parsed contents of a configuration file.
+        
+        Args:
+            config_path: Path to the configuration file
+            parse: Function turning the file's text into data, used on a miss
+            persist: Whether to use the on-disk cache for this file
+            
+        Returns:
+            A private copy of the parsed data
+            
+        Raises:
+            OSError: If the file cannot be read
+            Exception: Whatever parse raises for invalid content
+        """
+        key = os.path.abspath(config_path)
+        stat = os.stat(key)
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+            self._entries.move_to_end(key)
+            return copy.deepcopy(entry[2])
+        
+        persist = persist and self.cache_dir is not None
+        data = self._read_persisted(key, mtime_ns, size) if persist else None
+        
+        if data is None:
+            with open(config_path, 'r') as f:
+                content = f.read()
+            data = parse(content)
+            
+            if persist:
+                self._write_persisted(key, mtime_ns, size, data)
+        
+        self._entries[key] = (mtime_ns, size, data)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        
+        return copy.deepcopy(data)
+    
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+    
+    def _persisted_path(self, key: str) -> Path:
+        """Get the on-disk cache file for a configuration path."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"rules-{digest}.json"
+    
+    def _read_persisted(self, key: str, mtime_ns: int, size: int) -> Any:
+        """
+        Read persisted data for a configuration file if it is still current.
+        
+        Returns:
+            Parsed data, or None if there is no usable entry
+        """
+        try:
+            with open(self._persisted_path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
+            return None
+        return entry.get("data")
+    
+    def _write_persisted(self, key: str, mtime_ns: int, size: int, data: Any) -> None:
+        """Persist parsed data, skipping anything JSON cannot represent exactly."""
+        try:
+            encoded = json.dumps(data)
+            if data is None or json.loads(encoded) != data:
+                return
+            
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._persisted_path(key), 'w') as f:
+                json.dump({"mtime_ns": mtime_ns, "size": size, "data": data}, f)
+            
+            self._prune_persisted()
+        except (OSError, TypeError, ValueError):
+            # The disk cache is best-effort only
+            pass
+    
+    def _prune_persisted(self) -> None:
+        """Remove the oldest persisted entries beyond max_entries."""
+        cached = list(self.cache_dir.glob("rules-*.json"))
+        if len(cached) <= self.max_entries:
+            return
+        
+        cached.sort(key=lambda p: p.stat().st_mtime)
+        for path in cached[:len(cached) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+# Shared in-memory cache used by RuleEngine instances by default
+default_rules_cache = RulesCache()
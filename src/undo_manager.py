@@ -2,11 +2,11 @@
 
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
 from src.models import Operation, OperationResults, OperationType
-from src.filesystem import FileSystem, FileSystemError
+from src.filesystem import FileSystem, FileSystemError, list_names
 
 
 class UndoManagerError(Exception):
@@ -63,25 +63,30 @@ class UndoManager:
             Path to the saved log file
         """
         if log_path is None:
-            # Generate timestamped filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Generate timestamped filename; names sort in save order, which
+            # _get_most_recent_log and get_log_files rely on instead of mtimes
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             log_path = self.log_dir / f"undo_log_{timestamp}.json"
         
         # Convert operations to JSON-serializable format
-        operations_data = []
-        for op in self.current_operations:
-            op_dict = {
+        operations_data = [
+            {
                 "operation_type": op.operation_type.value,
                 "source_path": str(op.source_path),
                 "dest_path": str(op.dest_path),
-                "timestamp": op.timestamp.isoformat(),
+                "timestamp": op.timestamp.isoformat() if op.timestamp else None,
                 "executed": op.executed
             }
-            operations_data.append(op_dict)
+            for op in self.current_operations
+        ]
         
-        # Write to file
+        # Write one operation per line; json only uses its C encoder when
+        # indent is not set, and this layout keeps the log readable
+        encode = json.JSONEncoder().encode
         with open(log_path, 'w') as f:
-            json.dump(operations_data, f, indent=2)
+            f.write("[\n")
+            f.write(",\n".join(map(encode, operations_data)))
+            f.write("\n]\n")
         
         return log_path
     
@@ -105,11 +110,12 @@ class UndoManager:
             # Convert JSON data back to Operation objects
             operations = []
             for op_dict in operations_data:
+                timestamp = op_dict["timestamp"]
                 operation = Operation(
                     operation_type=OperationType(op_dict["operation_type"]),
                     source_path=Path(op_dict["source_path"]),
                     dest_path=Path(op_dict["dest_path"]),
-                    timestamp=datetime.fromisoformat(op_dict["timestamp"]),
+                    timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
                     executed=op_dict["executed"]
                 )
                 operations.append(operation)
@@ -151,20 +157,26 @@ class UndoManager:
             raise UndoManagerError("No operations found in undo log")
         
         # Reverse operations in reverse order (LIFO)
-        successful = 0
-        skipped = 0
-        errors = []
-        reversed_operations = []
+        results = OperationResults()
+        
+        # Names present in each destination directory, listed once per
+        # directory instead of stat'ing every destination
+        dir_contents: Dict[Path, Set[str]] = {}
         
         for operation in reversed(operations):
             try:
                 # Only undo executed operations
                 if not operation.executed:
-                    skipped += 1
+                    results.skipped += 1
                     continue
                 
                 # Reverse the operation: move from dest back to source
-                if operation.dest_path.exists():
+                dest_dir = operation.dest_path.parent
+                contents = dir_contents.get(dest_dir)
+                if contents is None:
+                    contents = dir_contents[dest_dir] = list_names(dest_dir)
+                
+                if operation.dest_path.name in contents:
                     # Create a reverse operation for tracking
                     reverse_op = Operation(
                         operation_type=OperationType.UNDO,
@@ -177,30 +189,31 @@ class UndoManager:
                     # Perform the reverse move
                     self.filesystem.move_file(operation.dest_path, operation.source_path)
                     
+                    # Keep the listings current for later operations in the log
+                    contents.discard(operation.dest_path.name)
+                    source_contents = dir_contents.get(operation.source_path.parent)
+                    if source_contents is not None:
+                        source_contents.add(operation.source_path.name)
+                    
                     reverse_op.executed = True
-                    reversed_operations.append(reverse_op)
-                    successful += 1
+                    results.operations.append(reverse_op)
+                    results.successful += 1
                 else:
                     # File doesn't exist at destination, can't undo
-                    errors.append((operation.dest_path, "File not found at destination"))
-                    skipped += 1
+                    results.errors.append((operation.dest_path, "File not found at destination"))
+                    results.skipped += 1
                     
             except FileSystemError as e:
                 # Log error but continue with remaining operations
-                errors.append((operation.dest_path, str(e)))
+                results.errors.append((operation.dest_path, str(e)))
             except Exception as e:
                 # Catch any unexpected errors
-                errors.append((operation.dest_path, f"Unexpected error: {e}"))
+                results.errors.append((operation.dest_path, f"Unexpected error: {e}"))
         
         # Clean up empty directories after undo
         self._cleanup_empty_directories(operations)
         
-        return OperationResults(
-            successful=successful,
-            skipped=skipped,
-            errors=errors,
-            operations=reversed_operations
-        )
+        return results
     
     def _get_most_recent_log(self) -> Optional[Path]:
         """
@@ -209,16 +222,9 @@ class UndoManager:
         Returns:
             Path to the most recent log file, or None if no logs exist
         """
-        # List all log files in the log directory
-        log_files = list(self.log_dir.glob("undo_log_*.json"))
-        
-        if not log_files:
-            return None
-        
-        # Sort by modification time (most recent first)
-        log_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        
-        return log_files[0]
+        # Log names embed their save time, so the newest one has the
+        # greatest name and no file needs to be stat'ed
+        return max(self.log_dir.glob("undo_log_*.json"), key=lambda p: p.name, default=None)
     
     def _cleanup_empty_directories(self, operations: List[Operation]) -> None:
         """
@@ -254,15 +260,15 @@ class UndoManager:
         Returns:
             True if at least one undo log exists, False otherwise
         """
-        return self._get_most_recent_log() is not None
+        # Any log will do, so stop at the first one without stat'ing it
+        return next(self.log_dir.glob("undo_log_*.json"), None) is not None
     
     def get_log_files(self) -> List[Path]:
         """
         Get a list of all available undo log files.
         
         Returns:
-            List of paths to undo log files, sorted by modification time (most recent first)
+            List of paths to undo log files, most recent first (by the save
+            time embedded in their names)
         """
-        log_files = list(self.log_dir.glob("undo_log_*.json"))
-        log_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return log_files
+        return sorted(self.log_dir.glob("undo_log_*.json"), key=lambda p: p.name, reverse=True)
@@ -0,0 +1,82 @@
+"""Hypothesis settings profiles for the property-based tests.
+
+The default "dev" profile runs a fixed, derandomized set of 25 examples per
+property so local and PR runs are fast and repeatable. Properties touch the
+disk, so neither profile has a per-example deadline. Set
+HYPOTHESIS_PROFILE=full to run 100 freshly generated examples per property;
+failing examples it finds are saved to the example database and replayed
+first on later runs. HYPOTHESIS_DATABASE moves that database, e.g. to a
+directory the CI caches between runs.
+
+On Linux, while the property tests run, tempfile's default directory is the
+/dev/shm tmpfs unless TMPDIR is set. The properties build their file trees
+with tempfile rather than tmp_path, so those trees never touch a block
+device; pytest's own tmp_path directories stay where pytest keeps them.
+Under pytest-xdist (pytest -n auto) each worker gets its own directory in
+/dev/shm, removed when the package finishes. The previous default is
+restored afterwards, so other tests are unaffected.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+from hypothesis import HealthCheck, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+
+SHM_DIR = "/dev/shm"
+
+
+@pytest.fixture(scope="package", autouse=True)
+def shm_tempdir(tmp_path_factory):
+    """Point tempfile at /dev/shm for the property tests, then restore it."""
+    if not (
+        sys.platform == "linux"
+        and "TMPDIR" not in os.environ
+        and os.path.isdir(SHM_DIR)
+        and os.access(SHM_DIR, os.W_OK)
+    ):
+        yield
+        return
+    
+    # Settle pytest's own base directory first so tmp_path stays where
+    # pytest manages it and is not removed with the worker directory
+    tmp_path_factory.getbasetemp()
+    
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    worker_dir = os.path.join(SHM_DIR, f"pytest-{worker}") if worker else None
+    if worker_dir:
+        os.makedirs(worker_dir, exist_ok=True)
+    
+    previous = tempfile.tempdir
+    tempfile.tempdir = worker_dir or SHM_DIR
+    try:
+        yield
+    finally:
+        tempfile.tempdir = previous
+        if worker_dir:
+            shutil.rmtree(worker_dir, ignore_errors=True)
+
+
+settings.register_profile(
+    "dev",
+    max_examples=25,
+    derandomize=True,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+# derandomize=True implies no database, so only the full profile keeps one
+database_dir = os.environ.get("HYPOTHESIS_DATABASE")
+full_database = {"database": DirectoryBasedExampleDatabase(database_dir)} if database_dir else {}
+
+settings.register_profile(
+    "full",
+    max_examples=100,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+    **full_database,
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
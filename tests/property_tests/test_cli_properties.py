@@ -3,7 +3,7 @@
 import tempfile
 from pathlib import Path
 from click.testing import CliRunner
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 
 from src.cli import cli
 from src.models import OperationResults, Operation, OperationType
@@ -51,7 +51,6 @@ class TestVerboseOutputProperty:
     """Test verbose mode output properties."""
     
     @given(operations=operation_lists())
-    @settings(max_examples=100)
     def test_verbose_output_contains_all_operation_details(self, operations):
         """
         **Feature: file-organizer, Property 24: Verbose mode output detail**
@@ -114,7 +113,6 @@ class TestVerboseOutputProperty:
             sys.stdout = old_stdout
     
     @given(operations=operation_lists())
-    @settings(max_examples=100)
     def test_verbose_output_shows_progress_for_large_operations(self, operations):
         """
         For any operation with more than 10 files, verbose mode should show
@@ -159,7 +157,6 @@ class TestVerboseOutputProperty:
             sys.stdout = old_stdout
     
     @given(operations=operation_lists())
-    @settings(max_examples=100)
     def test_non_verbose_output_omits_details(self, operations):
         """
         For any operation executed in non-verbose mode, the output should
@@ -1,34 +1,88 @@
 """Property-based tests for FileSystem component."""
 
-import tempfile
+import os
+import random
 import shutil
+import string
+import tempfile
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 
 from src.filesystem import FileSystem, PathError, PermissionError
 
 
+@pytest.fixture(scope="module")
+def shared_tmp():
+    """Parent directory shared by every example in this module."""
+    root = Path(tempfile.mkdtemp(prefix="fs_props"))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def fs():
+    """
+    FileSystem shared by every example.
+    
+    Its only state is the free-space cache, keyed by directory; every
+    example works in a fresh directory, so entries never carry over.
+    """
+    return FileSystem()
+
+
+def _remove_tree(path):
+    """Remove a directory tree with one scandir pass per directory."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+@contextmanager
+def example_dir(shared_tmp):
+    """Fresh directory for one Hypothesis example, removed afterwards."""
+    path = shared_tmp / uuid.uuid4().hex
+    path.mkdir()
+    try:
+        yield path
+    finally:
+        _remove_tree(path)
+
+
 # Custom strategies for generating test data
-@st.composite
-def file_names(draw):
-    """Generate realistic filenames with extensions."""
-    # Generate base name (alphanumeric with some special chars)
-    base = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'), whitelist_characters='-_'),
-        min_size=1,
-        max_size=20
-    ))
-    # Generate extension
-    extensions = ['.txt', '.pdf', '.jpg', '.png', '.doc', '.csv', '.json']
-    ext = draw(st.sampled_from(extensions))
-    return base + ext
-
-
-@st.composite
-def file_content(draw):
-    """Generate file content."""
-    return draw(st.binary(min_size=0, max_size=1024))
+EXTENSIONS = ('.txt', '.pdf', '.jpg', '.png', '.doc', '.csv', '.json')
+
+
+def _random_bases(count, seed=0):
+    """Build realistic filename bases (alphanumeric with '-' and '_')."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + '-_'
+    return [''.join(rng.choices(alphabet, k=rng.randint(1, 20))) for _ in range(count)]
+
+
+# Filenames generated once at import; drawing one is a tuple index
+BASES = _random_bases(2000)
+FILE_NAMES = tuple(base + ext for base in BASES for ext in EXTENSIONS)
+
+# Realistic filenames with extensions
+file_names = st.sampled_from(FILE_NAMES)
+
+
+@pytest.fixture(scope="module")
+def file_pool():
+    """Template file per extension, hard-linked into examples as source files."""
+    pool_dir = Path(tempfile.mkdtemp(prefix="pool"))
+    pool = {ext: pool_dir / f"template{ext}" for ext in EXTENSIONS}
+    for path in pool.values():
+        path.write_bytes(b"x" * 64)
+    yield pool
+    shutil.rmtree(pool_dir, ignore_errors=True)
 
 
 class TestConflictResolution:
@@ -38,22 +92,17 @@ class TestConflictResolution:
     """
     
     @given(
-        filename=file_names(),
+        filename=file_names,
         num_conflicts=st.integers(min_value=1, max_value=5)
     )
-    @settings(max_examples=100)
-    def test_conflict_resolution_appends_numeric_suffix(self, filename, num_conflicts):
+    def test_conflict_resolution_appends_numeric_suffix(self, fs, shared_tmp, filename, num_conflicts):
         """
         For any file being moved to a destination where a file with the same name 
         already exists, the system should append a numeric suffix (e.g., "_1", "_2") 
         to the new filename to prevent overwriting.
         """
-        fs = FileSystem()
-        
         # Create a temporary directory for testing
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            
+        with example_dir(shared_tmp) as tmpdir_path:
             # Create the initial file at destination
             dest_path = tmpdir_path / filename
             dest_path.write_text("original content")
@@ -85,6 +134,35 @@ class TestConflictResolution:
                 expected_path = tmpdir_path / f"{stem}_{i}{suffix}"
                 assert expected_path.exists(), f"File with suffix _{i} should exist: {expected_path}"
                 assert expected_path.read_text() == f"content {i-1}", f"Content should match for file {i}"
+    
+    @given(
+        filename=file_names,
+        num_conflicts=st.integers(min_value=1, max_value=5)
+    )
+    def test_batch_move_appends_numeric_suffix(self, fs, shared_tmp, filename, num_conflicts):
+        """
+        For any batch of files moved to the same destination, batch_move should
+        resolve conflicts in input order exactly as repeated move_file calls do.
+        """
+        with example_dir(shared_tmp) as tmpdir_path:
+            dest_path = tmpdir_path / filename
+            dest_path.write_text("original content")
+            
+            sources = []
+            for i in range(num_conflicts):
+                source_path = tmpdir_path / f"source_{i}_{filename}"
+                source_path.write_text(f"content {i}")
+                sources.append(source_path)
+            
+            errors = fs.batch_move([(source, dest_path) for source in sources])
+            
+            assert errors == [None] * num_conflicts, f"Batch moves should all succeed: {errors}"
+            assert not any(source.exists() for source in sources), "Sources should be moved"
+            assert dest_path.read_text() == "original content", "Original file should be unchanged"
+            
+            for i in range(1, num_conflicts + 1):
+                expected_path = tmpdir_path / f"{dest_path.stem}_{i}{dest_path.suffix}"
+                assert expected_path.read_text() == f"content {i-1}", f"Content should match for file {i}"
 
 
 class TestErrorResilience:
@@ -94,11 +172,10 @@ class TestErrorResilience:
     """
     
     @given(
-        valid_files=st.lists(file_names(), min_size=2, max_size=10, unique=True),
+        valid_files=st.lists(file_names, min_size=2, max_size=10, unique=True),
         error_index=st.integers(min_value=0, max_value=9)
     )
-    @settings(max_examples=100)
-    def test_error_on_one_file_continues_processing_others(self, valid_files, error_index):
+    def test_error_on_one_file_continues_processing_others(self, fs, shared_tmp, file_pool, valid_files, error_index):
         """
         For any operation where errors occur on specific files, the system should 
         log each error and continue processing all remaining files without stopping.
@@ -107,34 +184,29 @@ class TestErrorResilience:
         if error_index >= len(valid_files):
             error_index = len(valid_files) - 1
         
-        fs = FileSystem()
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        with example_dir(shared_tmp) as tmpdir_path:
             dest_dir = tmpdir_path / "dest"
             dest_dir.mkdir()
             
-            # Create source files
-            source_files = []
-            for filename in valid_files:
-                source_path = tmpdir_path / filename
-                source_path.write_text(f"content of {filename}")
-                source_files.append(source_path)
+            # Plan (source, dest) paths once, then create the source files
+            plan = [(tmpdir_path / filename, dest_dir / filename) for filename in valid_files]
+            for source_path, _ in plan:
+                os.link(file_pool[source_path.suffix], source_path)
             
             # Track successful moves and errors
             successful_moves = []
             errors = []
             
             # Process all files, simulating an error on one
-            for idx, source_path in enumerate(source_files):
+            for idx, (source_path, dest_path) in enumerate(plan):
                 try:
                     if idx == error_index:
                         # Simulate an error by trying to move a non-existent file
                         non_existent = tmpdir_path / "non_existent_file.txt"
-                        fs.move_file(non_existent, dest_dir / source_path.name)
+                        fs.move_file(non_existent, dest_path)
                     else:
                         # Normal move operation
-                        fs.move_file(source_path, dest_dir / source_path.name)
+                        fs.move_file(source_path, dest_path)
                         successful_moves.append(source_path.name)
                 except (PathError, PermissionError) as e:
                     # Log the error and continue
@@ -154,38 +226,33 @@ class TestErrorResilience:
                 assert dest_file.exists(), f"Successfully moved file should exist: {dest_file}"
     
     @given(
-        filenames=st.lists(file_names(), min_size=3, max_size=8, unique=True)
+        filenames=st.lists(file_names, min_size=3, max_size=8, unique=True)
     )
-    @settings(max_examples=100)
-    def test_permission_error_does_not_stop_processing(self, filenames):
+    def test_permission_error_does_not_stop_processing(self, fs, shared_tmp, file_pool, filenames):
         """
         Test that permission errors on individual files don't stop processing of remaining files.
         """
-        fs = FileSystem()
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+        with example_dir(shared_tmp) as tmpdir_path:
             dest_dir = tmpdir_path / "dest"
             dest_dir.mkdir()
             
-            # Create all source files
-            for filename in filenames:
-                source_path = tmpdir_path / filename
-                source_path.write_text(f"content of {filename}")
+            # Plan (source, dest) paths once, then create all source files
+            plan = [(tmpdir_path / filename, dest_dir / filename) for filename in filenames]
+            for source_path, _ in plan:
+                os.link(file_pool[source_path.suffix], source_path)
             
             # Track results
             successful = []
             failed = []
             
             # Process files, with potential for errors
-            for filename in filenames:
-                source_path = tmpdir_path / filename
+            for source_path, dest_path in plan:
                 try:
                     if source_path.exists():
-                        fs.move_file(source_path, dest_dir / filename)
-                        successful.append(filename)
+                        fs.move_file(source_path, dest_path)
+                        successful.append(source_path.name)
                 except (PathError, PermissionError) as e:
-                    failed.append((filename, str(e)))
+                    failed.append((source_path.name, str(e)))
             
             # All files should have been processed (either successfully or with error logged)
             total_processed = len(successful) + len(failed)
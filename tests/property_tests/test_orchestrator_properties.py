@@ -1,16 +1,55 @@
 """Property-based tests for Orchestrator component."""
 
+import hashlib
+import os
 import tempfile
 import shutil
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 from datetime import datetime
+import pytest
 
 from src.orchestrator import Orchestrator
 from src.models import Config, OperationType, CaseType
 from src.filesystem import FileSystem
 
 
+# Contents of the generated files, encoded once
+FILE_CONTENTS = [f"Content {i}".encode() for i in range(20)]
+
+
+def _fast_write(path: Path, data: bytes):
+    """Write a small file with one open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _flat_cleanup(directory: Path):
+    """Remove a generated directory, falling back to rmtree if it has subdirectories."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                os.unlink(entry.path)
+        os.rmdir(directory)
+    except OSError:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def orchestrator():
+    """
+    Orchestrator shared by every example.
+    
+    Its undo manager buffers executed operations until execute saves the
+    log and clears it. Every example also clears it during cleanup, so a
+    failed example can't leak operations into the next one.
+    """
+    return Orchestrator()
+
+
 # Custom strategies for generating test data
 @st.composite
 def file_tree_with_files(draw):
@@ -29,7 +68,7 @@ def file_tree_with_files(draw):
         file_path = temp_dir / filename
         
         # Create the file with some content
-        file_path.write_text(f"Content {i}")
+        _fast_write(file_path, FILE_CONTENTS[i])
         files.append(file_path)
     
     return temp_dir, files
@@ -64,31 +103,43 @@ def rename_pattern_config(draw, target_dir):
     )
 
 
-def get_directory_snapshot(directory: Path):
+def get_directory_snapshot(directory: Path) -> bytes:
     """
     Create a snapshot of directory state for comparison.
     
-    Returns a set of (relative_path, content) tuples.
+    Returns a BLAKE2b digest of every directory and file path in sorted order,
+    along with each file's (inode, size, mtime_ns, ctime_ns). Files are never
+    read: any write, replace or rename changes one of those fields.
     """
-    snapshot = set()
+    root = str(directory)
+    found = []
+    stack = [root]
     
-    for item in directory.rglob('*'):
-        if item.is_file():
-            relative_path = item.relative_to(directory)
-            try:
-                content = item.read_text()
-                snapshot.add((str(relative_path), content))
-            except Exception:
-                # For binary files, just record existence
-                snapshot.add((str(relative_path), None))
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    found.append((os.path.relpath(entry.path, root) + os.sep, None))
+                elif entry.is_file(follow_symlinks=False):
+                    found.append((os.path.relpath(entry.path, root), entry))
     
-    return snapshot
+    digest = hashlib.blake2b(digest_size=16)
+    for relative_path, entry in sorted(found, key=lambda item: item[0]):
+        digest.update(relative_path.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+        if entry is not None:
+            info = entry.stat(follow_symlinks=False)
+            digest.update(b"%d:%d:%d:%d\0" % (
+                info.st_ino, info.st_size, info.st_mtime_ns, info.st_ctime_ns
+            ))
+    
+    return digest.digest()
 
 
 # **Feature: file-organizer, Property 10: Dry-run mode file system invariant**
-@settings(max_examples=100, deadline=None)
 @given(st.data())
-def test_dry_run_preserves_filesystem(data):
+def test_dry_run_preserves_filesystem(orchestrator, data):
     """
     Property 10: Dry-run mode file system invariant
     
@@ -116,7 +167,6 @@ def test_dry_run_preserves_filesystem(data):
         config.dry_run = True
         
         # Execute operation in dry-run mode
-        orchestrator = Orchestrator()
         results = orchestrator.execute(config)
         
         # Take snapshot after operation
@@ -133,14 +183,14 @@ def test_dry_run_preserves_filesystem(data):
     
     finally:
         # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        orchestrator.undo_manager.clear_current_log()
+        _flat_cleanup(temp_dir)
 
 
 
 # **Feature: file-organizer, Property 11: Dry-run output completeness**
-@settings(max_examples=100, deadline=None)
 @given(st.data())
-def test_dry_run_output_completeness(data):
+def test_dry_run_output_completeness(orchestrator, data):
     """
     Property 11: Dry-run output completeness
     
@@ -165,7 +215,6 @@ def test_dry_run_output_completeness(data):
         config.dry_run = True
         
         # Execute operation in dry-run mode
-        orchestrator = Orchestrator()
         results = orchestrator.execute(config)
         
         # Assert: Each operation should have complete information
@@ -197,14 +246,14 @@ def test_dry_run_output_completeness(data):
     
     finally:
         # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        orchestrator.undo_manager.clear_current_log()
+        _flat_cleanup(temp_dir)
 
 
 
 # **Feature: file-organizer, Property 12: Dry-run summary accuracy**
-@settings(max_examples=100, deadline=None)
 @given(st.data())
-def test_dry_run_summary_accuracy(data):
+def test_dry_run_summary_accuracy(orchestrator, data):
     """
     Property 12: Dry-run summary accuracy
     
@@ -229,7 +278,6 @@ def test_dry_run_summary_accuracy(data):
         config.dry_run = True
         
         # Execute operation in dry-run mode
-        orchestrator = Orchestrator()
         results = orchestrator.execute(config)
         
         # Count the number of operations in the results
@@ -251,14 +299,14 @@ def test_dry_run_summary_accuracy(data):
     
     finally:
         # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        orchestrator.undo_manager.clear_current_log()
+        _flat_cleanup(temp_dir)
 
 
 
 # **Feature: file-organizer, Property 4: Accurate operation reporting**
-@settings(max_examples=100, deadline=None)
 @given(st.data())
-def test_accurate_operation_reporting(data):
+def test_accurate_operation_reporting(orchestrator, data):
     """
     Property 4: Accurate operation reporting
     
@@ -284,9 +332,11 @@ def test_accurate_operation_reporting(data):
         config.dry_run = False
         
         # Execute operation
-        orchestrator = Orchestrator()
         results = orchestrator.execute(config)
         
+        # The undo log was saved and cleared, or nothing was logged
+        assert orchestrator.undo_manager.current_operations == []
+        
         # Count actual operations by category
         actual_successful = sum(1 for op in results.operations if op.executed)
         actual_errors = len(results.errors)
@@ -318,4 +368,5 @@ def test_accurate_operation_reporting(data):
     
     finally:
         # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        orchestrator.undo_manager.clear_current_log()
+        _flat_cleanup(temp_dir)
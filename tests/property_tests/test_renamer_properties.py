@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
 import pytest
 
 from src.renamer import Renamer, DuplicateNameError
@@ -71,7 +71,6 @@ class TestPatternReplacement:
         ),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg', '.png', '.doc'])
     )
-    @settings(max_examples=100)
     def test_pattern_replacement_preserves_extensions(
         self, base_names, pattern, replacement, extension
     ):
@@ -131,7 +130,6 @@ class TestPatternReplacement:
         replacement=st.sampled_from(['new', 'updated', 'final', '', 'v2']),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg', '.png'])
     )
-    @settings(max_examples=100)
     def test_pattern_replacement_replaces_all_occurrences(
         self, num_files, pattern, replacement, extension
     ):
@@ -193,7 +191,6 @@ class TestSequentialNumbering:
         filenames=st.lists(file_names(), min_size=1, max_size=20, unique=True),
         template=st.sampled_from(['file_{n}', 'doc_{n}', 'image_{n}', '{n}', 'photo_{n}'])
     )
-    @settings(max_examples=100)
     def test_sequential_numbering_preserves_extensions(self, filenames, template):
         """
         For any set of files renamed with sequential numbering, each file should 
@@ -248,7 +245,6 @@ class TestSequentialNumbering:
         num_files=st.integers(min_value=1, max_value=50),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg', '.png', '.doc'])
     )
-    @settings(max_examples=100)
     def test_sequential_numbering_produces_unique_numbers(self, num_files, extension):
         """
         Test that sequential numbering produces unique sequential numbers for all files.
@@ -302,7 +298,6 @@ class TestPrefixSuffixAddition:
             max_size=10
         )
     )
-    @settings(max_examples=100)
     def test_prefix_suffix_addition_preserves_extensions(self, filenames, prefix, suffix):
         """
         For any set of filenames and a prefix or suffix string, adding the 
@@ -360,7 +355,6 @@ class TestPrefixSuffixAddition:
         suffix=st.sampled_from(['_copy', '_backup', '_v2', '_final', '']),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg'])
     )
-    @settings(max_examples=100)
     def test_prefix_suffix_in_correct_positions(self, num_files, prefix, suffix, extension):
         """
         Test that prefix appears at the start and suffix at the end of the stem.
@@ -414,7 +408,6 @@ class TestCaseTransformation:
         extension=st.sampled_from(['.txt', '.pdf', '.jpg', '.png', '.doc']),
         case_type=st.sampled_from([CaseType.LOWERCASE, CaseType.UPPERCASE, CaseType.TITLE])
     )
-    @settings(max_examples=100)
     def test_case_transformation_preserves_extensions(self, filenames, extension, case_type):
         """
         For any filename and case transformation type (lowercase, uppercase, title case), 
@@ -473,7 +466,6 @@ class TestCaseTransformation:
         ),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg'])
     )
-    @settings(max_examples=100)
     def test_case_transformation_types(self, base_name, extension):
         """
         Test that each case type produces the expected transformation.
@@ -525,7 +517,6 @@ class TestDuplicateDetection:
             max_size=5
         )
     )
-    @settings(max_examples=100)
     def test_duplicate_detection_prevents_conflicts(
         self, base_name, num_duplicates, extension, pattern, replacement
     ):
@@ -578,7 +569,6 @@ class TestDuplicateDetection:
         ),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg'])
     )
-    @settings(max_examples=100)
     def test_duplicate_detection_with_existing_files(self, filenames, extension):
         """
         Test that duplicate detection works when destination files already exist.
@@ -627,7 +617,6 @@ class TestDuplicateDetection:
         num_files=st.integers(min_value=3, max_value=10),
         extension=st.sampled_from(['.txt', '.pdf', '.jpg'])
     )
-    @settings(max_examples=100)
     def test_no_false_positive_duplicate_detection(self, num_files, extension):
         """
         Test that duplicate detection doesn't raise false positives for unique renames.
@@ -4,7 +4,7 @@ import tempfile
 import json
 import yaml
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
 import pytest
 
 from src.rule_engine import RuleEngine, InvalidRuleError, RuleEngineError
@@ -81,7 +81,6 @@ class TestCustomRuleApplication:
         num_pdf_files=st.integers(min_value=0, max_value=10),
         num_jpg_files=st.integers(min_value=0, max_value=10)
     )
-    @settings(max_examples=100)
     def test_custom_rule_application(self, num_txt_files, num_pdf_files, num_jpg_files):
         """
         For any valid configuration file with custom rules, the system should 
@@ -184,7 +183,6 @@ class TestCustomRuleApplication:
     @given(
         num_files=st.integers(min_value=1, max_value=15)
     )
-    @settings(max_examples=100)
     def test_regex_pattern_matching(self, num_files):
         """
         Test that regex patterns work correctly for matching files.
@@ -256,7 +254,6 @@ class TestCustomRuleApplication:
     @given(
         format_type=st.sampled_from(['yaml', 'json'])
     )
-    @settings(max_examples=100)
     def test_both_yaml_and_json_formats(self, format_type):
         """
         Test that both YAML and JSON configuration formats work correctly.
@@ -313,7 +310,6 @@ class TestCustomRuleApplication:
         num_matching=st.integers(min_value=1, max_value=10),
         num_non_matching=st.integers(min_value=0, max_value=10)
     )
-    @settings(max_examples=100)
     def test_only_matching_files_get_operations(self, num_matching, num_non_matching):
         """
         Test that only files matching rules get operations created.
@@ -379,7 +375,6 @@ class TestRulePriorityOrdering:
     @given(
         num_files=st.integers(min_value=1, max_value=15)
     )
-    @settings(max_examples=100)
     def test_rule_priority_ordering(self, num_files):
         """
         For any file that matches multiple custom rules, only the first matching 
@@ -445,7 +440,6 @@ class TestRulePriorityOrdering:
     @given(
         num_files=st.integers(min_value=1, max_value=10)
     )
-    @settings(max_examples=100)
     def test_first_match_wins(self, num_files):
         """
         Test that once a file matches a rule, it doesn't match subsequent rules.
@@ -522,7 +516,6 @@ class TestRulePriorityOrdering:
             unique=True
         )
     )
-    @settings(max_examples=100)
     def test_priority_sorting(self, priorities):
         """
         Test that rules are applied in priority order regardless of definition order.
@@ -575,7 +568,6 @@ class TestRulePriorityOrdering:
         num_txt_files=st.integers(min_value=1, max_value=8),
         num_pdf_files=st.integers(min_value=1, max_value=8)
     )
-    @settings(max_examples=100)
     def test_different_files_different_rules(self, num_txt_files, num_pdf_files):
         """
         Test that different file types can match different rules based on priority.
@@ -653,7 +645,6 @@ class TestInvalidRuleErrorHandling:
         num_valid=st.integers(min_value=1, max_value=5),
         num_invalid=st.integers(min_value=1, max_value=5)
     )
-    @settings(max_examples=100)
     def test_invalid_rule_error_handling(self, num_valid, num_invalid):
         """
         For any configuration containing both valid and invalid rules, the system 
@@ -727,7 +718,6 @@ class TestInvalidRuleErrorHandling:
     @given(
         num_files=st.integers(min_value=1, max_value=10)
     )
-    @settings(max_examples=100)
     def test_invalid_regex_patterns_skipped(self, num_files):
         """
         Test that rules with invalid regex patterns are skipped during matching.
@@ -790,7 +780,6 @@ class TestInvalidRuleErrorHandling:
     @given(
         format_type=st.sampled_from(['yaml', 'json'])
     )
-    @settings(max_examples=100)
     def test_malformed_config_raises_error(self, format_type):
         """
         Test that malformed configuration files raise appropriate errors.
@@ -849,7 +838,6 @@ class TestInvalidRuleErrorHandling:
     @given(
         num_valid=st.integers(min_value=1, max_value=5)
     )
-    @settings(max_examples=100)
     def test_all_valid_rules_loaded_successfully(self, num_valid):
         """
         Test that when all rules are valid, all are loaded successfully.
@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import given, strategies as st, assume
 from datetime import datetime
 import pytest
 
@@ -26,7 +26,6 @@ class TestUndoLogCompleteness:
             OperationType.CUSTOM
         ])
     )
-    @settings(max_examples=100)
     def test_undo_log_completeness(self, num_operations, operation_type):
         """
         For any completed operation, the undo log should contain entries for 
@@ -103,7 +102,6 @@ class TestUndoLogCompleteness:
             max_size=15
         )
     )
-    @settings(max_examples=100)
     def test_log_preserves_operation_details(self, operations_data):
         """
         Test that all operation details (paths, types, timestamps) are preserved 
@@ -164,7 +162,6 @@ class TestUndoRoundTrip:
     @given(
         num_files=st.integers(min_value=1, max_value=15)
     )
-    @settings(max_examples=100)
     def test_undo_operation_round_trip(self, num_files):
         """
         For any set of file operations followed immediately by an undo command, 
@@ -264,7 +261,6 @@ class TestUndoRoundTrip:
             unique=True
         )
     )
-    @settings(max_examples=100)
     def test_undo_with_nested_directories(self, num_files, subdirs):
         """
         Test that undo works correctly with nested directory structures.
@@ -330,7 +326,6 @@ class TestPartialUndoResilience:
         num_files=st.integers(min_value=3, max_value=15),
         num_to_delete=st.integers(min_value=1, max_value=5)
     )
-    @settings(max_examples=100)
     def test_partial_undo_resilience(self, num_files, num_to_delete):
         """
         For any undo operation where some files cannot be restored, the system 
@@ -408,7 +403,6 @@ class TestPartialUndoResilience:
     @given(
         num_files=st.integers(min_value=5, max_value=15)
     )
-    @settings(max_examples=100)
     def test_undo_continues_after_errors(self, num_files):
         """
         Test that undo continues processing remaining files even when some 
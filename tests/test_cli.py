@@ -1,5 +1,6 @@
 """Unit tests for CLI argument parsing and command validation."""
 
+import shutil
 import tempfile
 from pathlib import Path
 from click.testing import CliRunner
@@ -16,6 +17,10 @@ class TestCLIArgumentParsing:
         self.runner = CliRunner()
         self.temp_dir = tempfile.mkdtemp()
     
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
     def test_organize_type_basic_command(self):
         """Test basic organize-type command with default options."""
         result = self.runner.invoke(cli, ['organize-type', '--dry-run'])
@@ -1,8 +1,11 @@
 """Unit tests for FileSystem component."""
 
+import errno
+import os
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 from src.filesystem import FileSystem, PathError, PermissionError, DiskSpaceError
@@ -58,6 +61,136 @@ class TestFileSystem:
             assert new_file.exists()
             assert new_file.read_text() == "new content"
     
+    def test_move_file_cross_device_fallback(self):
+        """Test that a cross-device move falls back to copy and unlink."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            source = tmpdir_path / "source.txt"
+            source.write_text("test content")
+            dest = tmpdir_path / "other" / "dest.txt"
+            
+            exdev = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("src.filesystem.os.link", side_effect=exdev):
+                fs.move_file(source, dest)
+            
+            assert not source.exists()
+            assert dest.read_text() == "test content"
+    
+    def test_check_disk_space_reuses_statvfs_probe(self):
+        """Test that repeated disk space checks share one statvfs call."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            source = tmpdir_path / "source.txt"
+            source.write_text("test content")
+            
+            with patch("src.filesystem.os.statvfs", wraps=os.statvfs) as statvfs:
+                fs._check_disk_space(source, tmpdir_path)
+                fs._check_disk_space(source, tmpdir_path)
+            
+            assert statvfs.call_count == 1
+    
+    def test_resolve_conflict_skips_numbered_copies(self):
+        """Test conflict resolution past a run of existing numbered files."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            (tmpdir_path / "file.txt").write_text("original")
+            for i in range(1, 38):
+                (tmpdir_path / f"file_{i}.txt").write_text("copy")
+            
+            resolved = fs._resolve_conflict(tmpdir_path / "file.txt")
+            
+            assert resolved == tmpdir_path / "file_38.txt"
+    
+    def test_resolve_conflict_reuses_gaps(self):
+        """Test conflict resolution picks the lowest free suffix."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            (tmpdir_path / "file.txt").write_text("original")
+            for i in (1, 2, 3, 4, 8):
+                (tmpdir_path / f"file_{i}.txt").write_text("copy")
+            
+            resolved = fs._resolve_conflict(tmpdir_path / "file.txt")
+            
+            assert resolved == tmpdir_path / "file_5.txt"
+    
+    def test_os_errors_map_to_filesystem_errors(self):
+        """Test that OS error codes are translated to FileSystem errors."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            source = tmpdir_path / "source.txt"
+            source.write_text("test content")
+            
+            no_space = OSError(errno.ENOSPC, "No space left on device")
+            with patch("src.filesystem.os.link", side_effect=no_space):
+                with pytest.raises(DiskSpaceError):
+                    fs.move_file(source, tmpdir_path / "dest.txt")
+            
+            denied = OSError(errno.EACCES, "Permission denied")
+            with patch("src.filesystem.os.link", side_effect=denied):
+                with pytest.raises(PermissionError):
+                    fs.move_file(source, tmpdir_path / "dest.txt")
+            
+            invalid = OSError(errno.ENAMETOOLONG, "File name too long")
+            with patch("src.filesystem.os.link", side_effect=invalid):
+                with pytest.raises(PathError):
+                    fs.move_file(source, tmpdir_path / "dest.txt")
+    
+    def test_move_file_without_hard_links(self):
+        """Test moves fall back to a reserved rename where links are unsupported."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            source = tmpdir_path / "source.txt"
+            source.write_text("new")
+            (tmpdir_path / "dest.txt").write_text("existing")
+            
+            unsupported = OSError(errno.EPERM, "Operation not permitted")
+            with patch("src.filesystem.os.link", side_effect=unsupported):
+                fs.move_file(source, tmpdir_path / "dest.txt")
+            
+            assert not source.exists()
+            assert (tmpdir_path / "dest.txt").read_text() == "existing"
+            assert (tmpdir_path / "dest_1.txt").read_text() == "new"
+    
+    def test_move_file_retries_claimed_name(self):
+        """Test a name claimed after conflict resolution is not overwritten."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            source = tmpdir_path / "source.txt"
+            source.write_text("new")
+            claimed = tmpdir_path / "dest.txt"
+            
+            real_link = os.link
+            
+            def link_after_claim(src, dst, **kwargs):
+                # Another mover takes the name between resolution and link
+                if dst == os.fspath(claimed) and not claimed.exists():
+                    claimed.write_text("other")
+                return real_link(src, dst, **kwargs)
+            
+            with patch("src.filesystem.os.link", side_effect=link_after_claim):
+                fs.move_file(source, claimed)
+            
+            assert claimed.read_text() == "other"
+            assert (tmpdir_path / "dest_1.txt").read_text() == "new"
+    
     def test_move_file_nonexistent_source(self):
         """Test moving non-existent file raises PathError."""
         fs = FileSystem()
@@ -70,6 +203,105 @@ class TestFileSystem:
             with pytest.raises(PathError):
                 fs.move_file(source, dest)
     
+    def test_move_file_directory_source(self):
+        """Test moving a directory raises PathError."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            source = tmpdir_path / "subdir"
+            source.mkdir()
+            
+            with pytest.raises(PathError):
+                fs.move_file(source, tmpdir_path / "dest")
+            
+            with pytest.raises(PathError):
+                fs.get_file_info(source)
+    
+    def test_batch_move(self):
+        """Test batch move across directories with conflicts and errors."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            names = ["a.txt", "b.txt", "c.pdf", "d.pdf"]
+            for name in names:
+                (tmpdir_path / name).write_text(name)
+            
+            pairs = [
+                (tmpdir_path / "a.txt", tmpdir_path / "text" / "same.txt"),
+                (tmpdir_path / "b.txt", tmpdir_path / "text" / "same.txt"),
+                (tmpdir_path / "missing.txt", tmpdir_path / "text" / "missing.txt"),
+                (tmpdir_path / "c.pdf", tmpdir_path / "pdf" / "c.pdf"),
+                (tmpdir_path / "d.pdf", tmpdir_path / "pdf" / "d.pdf"),
+            ]
+            
+            results = fs.batch_move(pairs, workers=4)
+            
+            assert [r is None for r in results] == [True, True, False, True, True]
+            assert isinstance(results[2], PathError)
+            assert (tmpdir_path / "text" / "same.txt").read_text() == "a.txt"
+            assert (tmpdir_path / "text" / "same_1.txt").read_text() == "b.txt"
+            assert (tmpdir_path / "pdf" / "c.pdf").read_text() == "c.pdf"
+            assert (tmpdir_path / "pdf" / "d.pdf").read_text() == "d.pdf"
+    
+    def test_batch_move_cross_directory_dependency(self):
+        """Test batch move keeps plan order when groups depend on each other."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            (tmpdir_path / "x").mkdir()
+            (tmpdir_path / "y").mkdir()
+            (tmpdir_path / "x" / "foo").write_text("x")
+            (tmpdir_path / "y" / "foo").write_text("y")
+            
+            pairs = [
+                (tmpdir_path / "y" / "foo", tmpdir_path / "x" / "foo"),
+                (tmpdir_path / "x" / "foo", tmpdir_path / "y" / "foo"),
+            ]
+            
+            with patch("src.filesystem.ThreadPoolExecutor") as executor:
+                results = fs.batch_move(pairs, workers=8)
+            
+            executor.assert_not_called()
+            assert results == [None, None]
+            assert sorted(p.name for p in (tmpdir_path / "x").iterdir()) == ["foo_1"]
+            assert (tmpdir_path / "x" / "foo_1").read_text() == "y"
+            assert (tmpdir_path / "y" / "foo").read_text() == "x"
+    
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+    def test_batch_move_into_directory_aliases(self):
+        """Test moves into two aliases of one directory never overwrite each other."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            real = tmpdir_path / "photos"
+            real.mkdir()
+            alias = tmpdir_path / "alias"
+            alias.symlink_to(real, target_is_directory=True)
+            (real / "a.jpg").write_text("existing")
+            
+            pairs = []
+            for i in range(40):
+                source = tmpdir_path / f"src{i}.jpg"
+                source.write_text(f"file {i}")
+                # Alternate spellings of the directory, all aiming at a.jpg/a_1.jpg
+                directory = real if i % 2 else alias
+                name = "a.jpg" if i % 4 < 2 else "a_1.jpg"
+                pairs.append((source, directory / name))
+            
+            # Both spellings are one directory, so they share one worker
+            with patch("src.filesystem.ThreadPoolExecutor") as executor:
+                results = fs.batch_move(pairs, workers=8)
+            
+            executor.assert_not_called()
+            assert results == [None] * 40
+            contents = sorted(path.read_text() for path in real.iterdir())
+            assert contents == sorted(["existing"] + [f"file {i}" for i in range(40)])
+    
     def test_create_directory(self):
         """Test directory creation."""
         fs = FileSystem()
@@ -104,6 +336,54 @@ class TestFileSystem:
             txt_files = fs.list_files(tmpdir_path, "*.txt")
             assert len(txt_files) == 2
     
+    def test_list_files_nested_pattern(self):
+        """Test listing files with a pattern that reaches into a subdirectory."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            (tmpdir_path / "top.txt").write_text("content")
+            (tmpdir_path / "subdir").mkdir()
+            (tmpdir_path / "subdir" / "nested.txt").write_text("content")
+            
+            files = fs.list_files(tmpdir_path, "subdir/*.txt")
+            assert files == [tmpdir_path / "subdir" / "nested.txt"]
+    
+    def test_list_files_invalid_directory(self):
+        """Test listing a missing directory or a file raises PathError."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            file_path = tmpdir_path / "file.txt"
+            file_path.write_text("content")
+            
+            with pytest.raises(PathError):
+                fs.list_files(tmpdir_path / "missing")
+            
+            with pytest.raises(PathError):
+                fs.scan_files(file_path)
+    
+    def test_scan_files(self):
+        """Test scanning files returns metadata for matching files only."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            (tmpdir_path / "file1.txt").write_text("content")
+            (tmpdir_path / "file2.pdf").write_text("more content")
+            (tmpdir_path / "subdir.txt").mkdir()
+            
+            infos = fs.scan_files(tmpdir_path, "*.txt")
+            
+            assert len(infos) == 1
+            assert infos[0].path == tmpdir_path / "file1.txt"
+            assert infos[0].size == len("content")
+            assert infos[0].extension == ".txt"
+            assert infos[0].modified_time == (tmpdir_path / "file1.txt").stat().st_mtime
+    
     def test_get_file_info(self):
         """Test getting file metadata."""
         fs = FileSystem()
@@ -122,6 +402,20 @@ class TestFileSystem:
             assert info.modified_time is not None
             assert info.created_time is not None
     
+    def test_file_info_extensions_are_shared(self):
+        """Test that equal extensions share a single string object."""
+        fs = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            (tmpdir_path / "a.jpg").write_text("a")
+            (tmpdir_path / "b.jpg").write_text("b")
+            
+            first, second = fs.scan_files(tmpdir_path, "*.jpg")
+            
+            assert first.extension == ".jpg"
+            assert first.extension is second.extension
+    
     def test_rename_file(self):
         """Test file rename operation."""
         fs = FileSystem()
@@ -1,8 +1,11 @@
 """Unit tests for core data models."""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from src.models import (
     Config,
     Operation,
@@ -96,12 +99,62 @@ def test_file_info_creation():
     file_info = FileInfo(
         path=Path("/tmp/test.txt"),
         size=1024,
-        modified_time=now,
-        created_time=now,
+        modified_time=now.timestamp(),
+        created_time=now.timestamp(),
         extension=".txt",
     )
     assert file_info.path == Path("/tmp/test.txt")
     assert file_info.size == 1024
-    assert file_info.modified_time == now
-    assert file_info.created_time == now
+    assert file_info.modified_time == now.timestamp()
+    assert file_info.created_time == now.timestamp()
+    assert file_info.modified_datetime == now
+    assert file_info.created_datetime == now
     assert file_info.extension == ".txt"
+
+
+def test_file_info_missing_times():
+    """Test FileInfo datetime accessors when times are unavailable."""
+    file_info = FileInfo(
+        path=Path("/tmp/test.txt"),
+        size=0,
+        modified_time=None,
+        created_time=None,
+        extension=".txt",
+    )
+    assert file_info.modified_datetime is None
+    assert file_info.created_datetime is None
+
+
+def test_rule_is_frozen_and_hashable():
+    """Test that Rule instances are immutable and usable as set members."""
+    rule = Rule(name="Docs", pattern="*.pdf", destination="docs", priority=1)
+    
+    with pytest.raises(FrozenInstanceError):
+        rule.priority = 2
+    
+    assert len({rule, Rule(name="Docs", pattern="*.pdf", destination="docs", priority=1)}) == 1
+
+
+def test_operation_results_add():
+    """Test that OperationResults counts outcomes as they are added."""
+    results = OperationResults()
+    ok = Operation(
+        operation_type=OperationType.RENAME,
+        source_path=Path("/tmp/ok.txt"),
+        dest_path=Path("/tmp/renamed.txt"),
+        timestamp=datetime.now(),
+    )
+    failed = Operation(
+        operation_type=OperationType.RENAME,
+        source_path=Path("/tmp/failed.txt"),
+        dest_path=Path("/tmp/other.txt"),
+        timestamp=datetime.now(),
+    )
+    
+    results.add(ok)
+    results.add(failed, "Permission denied")
+    
+    assert results.successful == 1
+    assert results.skipped == 0
+    assert results.errors == [(Path("/tmp/failed.txt"), "Permission denied")]
+    assert results.operations == [ok, failed]
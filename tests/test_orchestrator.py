@@ -1,12 +1,14 @@
 """Unit tests for Orchestrator component."""
 
+import itertools
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 from src.orchestrator import Orchestrator, OrchestratorError
-from src.models import Config, OperationType, CaseType
+from src.models import Config, Operation, OperationType, CaseType
 from src.filesystem import FileSystem
 
 
@@ -125,6 +127,62 @@ class TestOrchestrator:
         assert len(operations) == 2
         assert operations[0].dest_path.name in ["doc_1.txt", "doc_2.txt"]
     
+    def test_timestamp_set_on_execution(self):
+        """Test that operations are timestamped when executed, not when planned."""
+        (self.temp_dir / "doc.pdf").write_text("content")
+        
+        config = Config(
+            target_dir=self.temp_dir,
+            operation_type=OperationType.ORGANIZE_TYPE
+        )
+        
+        operations = self.orchestrator.plan_operations(config)
+        assert all(op.timestamp is None for op in operations)
+        
+        results = self.orchestrator.execute_operations(operations, dry_run=False)
+        
+        assert results.successful == 1
+        assert operations[0].timestamp is not None
+    
+    def test_timestamp_meaning_same_on_both_paths(self):
+        """Test that serial and parallel batches stamp each operation as its move starts."""
+        ticks = itertools.count()
+        started = {}
+        move_file = self.orchestrator.filesystem.move_file
+        
+        def record_start(source, dest):
+            started[source] = next(ticks)
+            return move_file(source, dest)
+        
+        threshold = Orchestrator.PARALLEL_THRESHOLD
+        for count in (threshold - 1, threshold):
+            batch_dir = self.temp_dir / f"batch{count}"
+            batch_dir.mkdir()
+            operations = []
+            for i in range(count):
+                source = batch_dir / f"file{i}.txt"
+                # The last source is missing, so that operation fails
+                if i < count - 1:
+                    source.write_text("content")
+                operations.append(Operation(
+                    operation_type=OperationType.ORGANIZE_TYPE,
+                    source_path=source,
+                    dest_path=batch_dir / ("odd" if i % 2 else "even") / source.name
+                ))
+            
+            with patch("src.orchestrator.datetime") as clock, patch.object(
+                self.orchestrator.filesystem, 'move_file', side_effect=record_start
+            ):
+                clock.now.side_effect = lambda: next(ticks)
+                results = self.orchestrator.execute_operations(operations)
+            
+            assert results.successful == count - 1
+            assert len(results.errors) == 1
+            # One stamp per operation, taken before its own move
+            assert len({op.timestamp for op in operations}) == count
+            for op in operations:
+                assert op.timestamp < started[op.source_path]
+    
     def test_execute_operations_with_errors(self):
         """Test that errors are properly reported."""
         # Create a test file
@@ -150,6 +208,54 @@ class TestOrchestrator:
         # Should have an error
         assert len(results.errors) > 0
     
+    def test_execute_creates_each_directory_once(self):
+        """Test that a shared destination directory is only created once."""
+        for name in ["a.pdf", "b.pdf", "c.txt", "d.jpg"]:
+            (self.temp_dir / name).write_text("content")
+        
+        config = Config(
+            target_dir=self.temp_dir,
+            operation_type=OperationType.ORGANIZE_TYPE,
+            dry_run=False
+        )
+        
+        with patch.object(
+            self.orchestrator.filesystem, 'create_directory',
+            wraps=self.orchestrator.filesystem.create_directory
+        ) as create_directory:
+            results = self.orchestrator.execute(config)
+        
+        assert results.successful == 4
+        assert create_directory.call_count == 2
+        assert (self.temp_dir / "documents" / "c.txt").exists()
+        assert (self.temp_dir / "images" / "d.jpg").exists()
+    
+    def test_execute_large_batch_in_parallel(self):
+        """Test that large batches are moved on the thread pool."""
+        names = [f"file{i}{ext}" for i in range(10) for ext in [".pdf", ".jpg", ".py"]]
+        for name in names:
+            (self.temp_dir / name).write_text("content")
+        
+        config = Config(
+            target_dir=self.temp_dir,
+            operation_type=OperationType.ORGANIZE_TYPE,
+            dry_run=False
+        )
+        
+        with patch.object(Orchestrator, 'PARALLEL_THRESHOLD', 2), patch.object(
+            self.orchestrator.filesystem, 'batch_move',
+            wraps=self.orchestrator.filesystem.batch_move
+        ) as batch_move:
+            results = self.orchestrator.execute(config)
+        
+        assert batch_move.call_count == 1
+        assert results.successful == len(names)
+        assert sorted(op.source_path.name for op in results.operations) == sorted(names)
+        assert (self.temp_dir / "documents" / "file3.pdf").exists()
+        assert (self.temp_dir / "images" / "file3.jpg").exists()
+        assert (self.temp_dir / "code" / "file3.py").exists()
+        assert self.orchestrator.undo_manager.has_undo_log()
+    
     def test_undo_logging(self):
         """Test that operations are logged for undo."""
         # Create test files
@@ -196,6 +302,30 @@ class TestOrchestrator:
         with pytest.raises(OrchestratorError):
             self.orchestrator.plan_operations(config)
     
+    def test_plan_operations_undo_rejected(self):
+        """Test that undo cannot be planned like other operations."""
+        (self.temp_dir / "test.txt").write_text("content")
+        
+        config = Config(
+            target_dir=self.temp_dir,
+            operation_type=OperationType.UNDO,
+        )
+        
+        with pytest.raises(OrchestratorError, match="undo_manager"):
+            self.orchestrator.plan_operations(config)
+    
+    def test_plan_operations_custom_requires_rules_file(self):
+        """Test that custom planning without a rules file fails."""
+        (self.temp_dir / "test.txt").write_text("content")
+        
+        config = Config(
+            target_dir=self.temp_dir,
+            operation_type=OperationType.CUSTOM,
+        )
+        
+        with pytest.raises(OrchestratorError, match="rules file"):
+            self.orchestrator.plan_operations(config)
+    
     def test_organize_by_date(self):
         """Test organizing files by date."""
         # Create test files
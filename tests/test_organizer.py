@@ -10,7 +10,7 @@ import pytest
 
 from src.organizer import Organizer
 from src.filesystem import FileSystem
-from src.models import OperationType
+from src.models import FileInfo, OperationType
 
 
 class TestOrganizer:
@@ -185,6 +185,29 @@ class TestOrganizer:
             assert operations[0].dest_path.name == "important_document.pdf"
             assert operations[0].source_path.name == operations[0].dest_path.name
     
+    def test_organize_by_date_accepts_file_info(self):
+        """Test that pre-fetched FileInfo objects are used without re-stat."""
+        organizer = Organizer()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            target_dir = tmpdir_path / "organized"
+            
+            # The file does not need to exist when metadata is supplied
+            test_date = datetime(2021, 11, 3, 12, 0, 0)
+            file_info = FileInfo(
+                path=tmpdir_path / "scanned.txt",
+                size=7,
+                modified_time=time.mktime(test_date.timetuple()),
+                created_time=None,
+                extension=".txt",
+            )
+            
+            operations = organizer.organize_by_date([file_info], target_dir)
+            
+            assert operations[0].source_path == file_info.path
+            assert operations[0].dest_path == target_dir / "2021" / "11" / "scanned.txt"
+    
     def test_organize_custom_returns_empty_list(self):
         """Test that organize_custom returns empty list (not yet implemented)."""
         organizer = Organizer()
@@ -4,7 +4,7 @@ import tempfile
 from pathlib import Path
 import pytest
 
-from src.renamer import Renamer, DuplicateNameError
+from src.renamer import Renamer, DuplicateNameError, _split_name
 from src.models import CaseType, OperationType
 
 
@@ -64,6 +64,20 @@ class TestRenamer:
             with pytest.raises(DuplicateNameError):
                 renamer.rename_pattern([file1, file2], "report", "summary")
     
+    def test_rename_pattern_detects_existing_file(self):
+        """Test that a rename onto a file outside the batch is detected."""
+        renamer = Renamer()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            
+            file1 = tmpdir_path / "old_notes.txt"
+            file1.write_text("content")
+            (tmpdir_path / "new_notes.txt").write_text("content")
+            
+            with pytest.raises(DuplicateNameError):
+                renamer.rename_pattern([file1], "old", "new")
+    
     def test_rename_sequential_basic(self):
         """Test basic sequential numbering."""
         renamer = Renamer()
@@ -221,3 +235,11 @@ class TestRenamer:
             
             # No operations should be created
             assert len(operations) == 0
+    
+    def test_split_name_matches_pathlib(self):
+        """Test that filename splitting agrees with Path.stem and Path.suffix."""
+        names = ["report.txt", "archive.tar.gz", "README", ".bashrc", "trailing.", "a.b"]
+        
+        for name in names:
+            path = Path(name)
+            assert _split_name(name) == (path.stem, path.suffix)
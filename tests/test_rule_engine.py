@@ -0,0 +1,166 @@
+"""Unit tests for RuleEngine component."""
+
+import fnmatch
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from src.rule_engine import RuleEngine, _compile_combined_pattern, _compile_rule_pattern
+from src.models import Rule
+
+
+class TestLoadRules:
+    """Test loading rules from configuration files."""
+    
+    def test_invalid_rules_logged_and_skipped(self, caplog):
+        """Test that invalid rules are reported as a warning and skipped."""
+        engine = RuleEngine()
+        config = {
+            "rules": [
+                {"name": "PDFs", "pattern": "*.pdf", "destination": "docs"},
+                {"name": "Broken", "pattern": "*.txt"},
+            ]
+        }
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "rules.json"
+            config_path.write_text(json.dumps(config))
+            
+            with caplog.at_level(logging.WARNING, logger="src.rule_engine"):
+                rules = engine.load_rules(config_path)
+        
+        assert [rule.name for rule in rules] == ["PDFs"]
+        assert "Missing required field: destination" in caplog.text
+
+
+class TestMatchFile:
+    """Test matching files against single rules."""
+    
+    def test_glob_pattern(self):
+        """Test that glob patterns match the whole filename."""
+        engine = RuleEngine()
+        rule = Rule(name="PDFs", pattern="*.pdf", destination="docs", priority=0)
+        
+        assert engine.match_file(Path("/tmp/report.pdf"), rule)
+        assert not engine.match_file(Path("/tmp/report.pdf.bak"), rule)
+    
+    def test_regex_pattern(self):
+        """Test that regex patterns match from the start of the filename."""
+        engine = RuleEngine()
+        rule = Rule(name="Tests", pattern="regex:^test_.*", destination="tests", priority=0)
+        
+        assert engine.match_file(Path("/tmp/test_one.py"), rule)
+        assert not engine.match_file(Path("/tmp/my_test_one.py"), rule)
+    
+    def test_invalid_regex_never_matches(self):
+        """Test that an invalid regex rule matches nothing."""
+        engine = RuleEngine()
+        rule = Rule(name="Broken", pattern="regex:[invalid(", destination="x", priority=0)
+        
+        assert not engine.match_file(Path("/tmp/[invalid("), rule)
+    
+    def test_patterns_compiled_once(self):
+        """Test that each pattern is compiled once and then reused."""
+        assert _compile_rule_pattern("*.txt") is _compile_rule_pattern("*.txt")
+        assert _compile_rule_pattern("regex:^a") is _compile_rule_pattern("regex:^a")
+
+
+class TestApplyRules:
+    """Test applying rule sets to files."""
+    
+    def test_first_matching_rule_in_priority_order_wins(self):
+        """Test that the highest-priority matching rule is used."""
+        engine = RuleEngine()
+        rules = [
+            Rule(name="Any", pattern="*", destination="other", priority=2),
+            Rule(name="Reports", pattern="regex:^report", destination="reports", priority=1),
+            Rule(name="PDFs", pattern="*.pdf", destination="docs", priority=0),
+        ]
+        files = [Path("/src/report.pdf"), Path("/src/report.txt"), Path("/src/notes.md")]
+        
+        operations = engine.apply_rules(files, rules, Path("/dest"))
+        
+        assert [op.dest_path for op in operations] == [
+            Path("/dest/docs/report.pdf"),
+            Path("/dest/reports/report.txt"),
+            Path("/dest/other/notes.md"),
+        ]
+    
+    def test_combined_pattern_skips_invalid_regex(self):
+        """Test that an invalid regex rule doesn't shift the other rules."""
+        engine = RuleEngine()
+        rules = [
+            Rule(name="Broken", pattern="regex:[invalid(", destination="broken", priority=0),
+            Rule(name="Text", pattern="*.txt", destination="text", priority=1),
+        ]
+        
+        operations = engine.apply_rules([Path("/src/a.txt")], rules, Path("/dest"))
+        
+        assert [op.dest_path for op in operations] == [Path("/dest/text/a.txt")]
+    
+    def test_regex_with_groups_falls_back_to_per_rule_matching(self):
+        """Test that regexes with their own groups still match correctly."""
+        engine = RuleEngine()
+        rules = [
+            Rule(name="Doubled", pattern=r"regex:^(\w)\1", destination="doubled", priority=0),
+            Rule(name="Text", pattern="*.txt", destination="text", priority=1),
+        ]
+        files = [Path("/src/aab.txt"), Path("/src/abc.txt")]
+        
+        assert _compile_combined_pattern(tuple(rule.pattern for rule in rules)) is None
+        
+        operations = engine.apply_rules(files, rules, Path("/dest"))
+        
+        assert [op.dest_path for op in operations] == [
+            Path("/dest/doubled/aab.txt"),
+            Path("/dest/text/abc.txt"),
+        ]
+    
+    def test_multi_star_glob_ahead_of_other_rules(self):
+        """Test that a multi-star glob doesn't shift which later rule matched."""
+        engine = RuleEngine()
+        rules = [
+            Rule(name="AB", pattern="*a*b*", destination="ab", priority=0),
+            Rule(name="Text", pattern="*.txt", destination="text", priority=1),
+            Rule(name="Images", pattern="*.jpg", destination="images", priority=2),
+        ]
+        files = [Path("/src/note.txt"), Path("/src/photo.jpg"), Path("/src/cab.jpg")]
+        
+        combined = _compile_combined_pattern(tuple(rule.pattern for rule in rules))
+        if any(_compile_rule_pattern(rule.pattern).groups for rule in rules):
+            assert combined is None
+        
+        operations = engine.apply_rules(files, rules, Path("/dest"))
+        
+        assert [op.dest_path for op in operations] == [
+            Path("/dest/text/note.txt"),
+            Path("/dest/images/photo.jpg"),
+            Path("/dest/ab/cab.jpg"),
+        ]
+    
+    def test_glob_translated_with_groups_falls_back(self, monkeypatch):
+        """Test that a glob translated into groups (as before 3.11) isn't fused."""
+        translate = fnmatch.translate
+        grouped = r"(?s:(?=(?P<g0>.*?a))(?P=g0)(?=(?P<g1>.*?b))(?P=g1).*)\Z"
+        monkeypatch.setattr(
+            fnmatch, "translate", lambda pat: grouped if pat == "*a*b*" else translate(pat)
+        )
+        _compile_rule_pattern.cache_clear()
+        _compile_combined_pattern.cache_clear()
+        
+        try:
+            engine = RuleEngine()
+            rules = [
+                Rule(name="AB", pattern="*a*b*", destination="ab", priority=0),
+                Rule(name="Text", pattern="*.txt", destination="text", priority=1),
+            ]
+            
+            assert _compile_combined_pattern(tuple(rule.pattern for rule in rules)) is None
+            
+            operations = engine.apply_rules([Path("/src/note.txt")], rules, Path("/dest"))
+            
+            assert [op.dest_path for op in operations] == [Path("/dest/text/note.txt")]
+        finally:
+            _compile_rule_pattern.cache_clear()
+            _compile_combined_pattern.cache_clear()
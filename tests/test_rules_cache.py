@@ -0,0 +1,99 @@
+"""Unit tests for RulesCache component."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from src.rules_cache import RulesCache
+
+
+class CountingParser:
+    """JSON parser that records how many times it was called."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self, content):
+        self.calls += 1
+        return json.loads(content)
+
+
+class TestRulesCache:
+    """Unit tests for RulesCache operations."""
+    
+    def test_load_reuses_parse_for_unchanged_file(self):
+        """Test that an unchanged file is only parsed once."""
+        cache = RulesCache()
+        parse = CountingParser()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / "rules.json"
+            config.write_text('{"rules": []}')
+            
+            first = cache.load(config, parse)
+            second = cache.load(config, parse)
+            
+            assert first == second == {"rules": []}
+            assert parse.calls == 1
+    
+    def test_load_returns_independent_copies(self):
+        """Test that mutating loaded data does not corrupt the cache."""
+        cache = RulesCache()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / "rules.json"
+            config.write_text('{"rules": []}')
+            
+            cache.load(config, json.loads)["rules"].append("changed")
+            
+            assert cache.load(config, json.loads) == {"rules": []}
+    
+    def test_load_reparses_modified_file(self):
+        """Test that a change in mtime or size invalidates the entry."""
+        cache = RulesCache()
+        parse = CountingParser()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = Path(tmpdir) / "rules.json"
+            config.write_text('{"rules": []}')
+            cache.load(config, parse)
+            
+            config.write_text('{"rules": [1]}')
+            stat = config.stat()
+            os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            
+            assert cache.load(config, parse) == {"rules": [1]}
+            assert parse.calls == 2
+    
+    def test_persisted_entry_used_by_new_cache(self):
+        """Test that a persisted parse is reused by another cache instance."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            config = tmpdir_path / "rules.json"
+            config.write_text('{"rules": []}')
+            
+            RulesCache(cache_dir=tmpdir_path / "cache").load(config, json.loads, persist=True)
+            
+            parse = CountingParser()
+            data = RulesCache(cache_dir=tmpdir_path / "cache").load(config, parse, persist=True)
+            
+            assert data == {"rules": []}
+            assert parse.calls == 0
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the cache holds at most max_entries files."""
+        cache = RulesCache(max_entries=2)
+        parse = CountingParser()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            configs = []
+            for i in range(3):
+                config = Path(tmpdir) / f"rules_{i}.json"
+                config.write_text('{"rules": []}')
+                configs.append(config)
+                cache.load(config, parse)
+            
+            cache.load(configs[0], parse)
+            
+            assert parse.calls == 4
@@ -238,6 +238,38 @@ class TestUndoOperations:
             assert not dest_file.exists()
             assert source_file.read_text() == "test content"
     
+    def test_undo_chained_renames(self):
+        """Test undoing renames where one operation's destination feeds the next."""
+        filesystem = FileSystem()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            undo_manager = UndoManager(filesystem=filesystem, log_dir=tmpdir_path / "logs")
+            
+            first = tmpdir_path / "a.txt"
+            second = tmpdir_path / "b.txt"
+            third = tmpdir_path / "c.txt"
+            first.write_text("content")
+            
+            # a -> b, then b -> c, all within one directory
+            for source, dest in [(first, second), (second, third)]:
+                filesystem.move_file(source, dest)
+                undo_manager.log_operation(Operation(
+                    operation_type=OperationType.RENAME,
+                    source_path=source,
+                    dest_path=dest,
+                    timestamp=datetime.now(),
+                    executed=True
+                ))
+            
+            results = undo_manager.undo(undo_manager.save_log())
+            
+            assert results.successful == 2
+            assert len(results.errors) == 0
+            assert first.read_text() == "content"
+            assert not second.exists()
+            assert not third.exists()
+    
     def test_undo_no_log_found(self):
         """Test undo when no log file exists."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -331,6 +363,27 @@ class TestGetLogFiles:
             
             assert len(log_files) == 0
     
+    def test_logs_saved_in_same_second_ordered_by_name(self):
+        """Test that back-to-back saves get distinct, save-ordered names."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_dir = Path(tmpdir) / "logs"
+            undo_manager = UndoManager(log_dir=log_dir)
+            
+            saved = []
+            for i in range(3):
+                undo_manager.log_operation(Operation(
+                    operation_type=OperationType.RENAME,
+                    source_path=Path(f"/tmp/file_{i}.txt"),
+                    dest_path=Path(f"/tmp/renamed_{i}.txt"),
+                    timestamp=datetime.now(),
+                    executed=True
+                ))
+                saved.append(undo_manager.save_log())
+                undo_manager.clear_current_log()
+            
+            assert undo_manager.get_log_files() == saved[::-1]
+            assert undo_manager._get_most_recent_log() == saved[-1]
+    
     def test_get_log_files_multiple(self):
         """Test getting multiple log files sorted by recency."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -338,8 +391,7 @@ class TestGetLogFiles:
             undo_manager = UndoManager(log_dir=log_dir)
             
             # Create multiple logs
-            import time
-            
+            saved = []
             for i in range(3):
                 operation = Operation(
                     operation_type=OperationType.RENAME,
@@ -349,14 +401,8 @@ class TestGetLogFiles:
                     executed=True
                 )
                 undo_manager.log_operation(operation)
-                time.sleep(1.1)  # Ensure different timestamps (save_log uses seconds precision)
-                undo_manager.save_log()
+                saved.append(undo_manager.save_log())
                 undo_manager.clear_current_log()
             
-            log_files = undo_manager.get_log_files()
-            
-            assert len(log_files) == 3
-            
-            # Verify they're sorted by recency (most recent first)
-            for i in range(len(log_files) - 1):
-                assert log_files[i].stat().st_mtime >= log_files[i + 1].stat().st_mtime
+            # Most recent first
+            assert undo_manager.get_log_files() == saved[::-1]